@@ -1,19 +1,59 @@
 """Dependencies Module.
 
-This file defines the dependencies for the API routes. It provides the language detection and the translation service.
+This file defines the dependencies for the API routes. It provides the application configuration, the detection,
+translation and routing services, the profiler, and the verification of the admin token protecting the admin routes.
 """
 
-from fastapi import Request
+import secrets
+from functools import lru_cache
+from typing import Annotated
 
+from fastapi import Depends, Header, HTTPException, status
+from starlette.requests import HTTPConnection
+
+from config import AppConfig
 from services.detection_service import DetectionService
+from services.routing_service import RoutingService
 from services.translation_service import TranslationService
+from utils.profiling import Profiler
+
+
+@lru_cache
+def get_config() -> AppConfig:
+    """Load the application configuration once and reuse it for every request."""
+    return AppConfig()
 
 
-def get_detection_service(request: Request) -> DetectionService:
+def get_detection_service(connection: HTTPConnection) -> DetectionService:
     """Retrieve the language detection service from the application state."""
-    return request.app.state.detection_service
+    return connection.app.state.detection_service
 
 
-def get_translation_service(request: Request) -> TranslationService:
+def get_translation_service(connection: HTTPConnection) -> TranslationService:
     """Get the translation service from the application state."""
-    return request.app.state.translation_service
+    return connection.app.state.translation_service
+
+
+def get_routing_service(connection: HTTPConnection) -> RoutingService:
+    """Retrieve the routing service from the application state."""
+    return connection.app.state.routing_service
+
+
+def get_profiler(connection: HTTPConnection) -> Profiler:
+    """Retrieve the profiler from the application state."""
+    return connection.app.state.profiler
+
+
+def verify_admin_token(
+    config: Annotated[AppConfig, Depends(get_config)],
+    x_admin_token: Annotated[str | None, Header()] = None,
+) -> None:
+    """Verify that the request carries the configured admin token.
+
+    Raises:
+        HTTPException: If no admin token is configured or the request does not carry it.
+    """
+    if config.admin_token is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Admin endpoints are disabled")
+    if x_admin_token is None or not secrets.compare_digest(x_admin_token, config.admin_token):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid admin token")
@@ -0,0 +1,91 @@
+"""Admin Endpoints.
+
+This module defines the API endpoints for operating the service. They are only available if an admin token is
+configured and require it in the `X-Admin-Token` header. The endpoints managing translation models are on a separate
+router, which is only included in standalone mode, as the service owns no models in router mode.
+"""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel
+
+from api.deps import get_profiler, get_translation_service, verify_admin_token
+from services.translation_service import TranslationService
+from utils.profiling import Profiler
+
+router = APIRouter(prefix="/admin", dependencies=[Depends(verify_admin_token)])
+models_router = APIRouter(prefix="/admin", dependencies=[Depends(verify_admin_token)])
+
+
+@router.post("/profile")  # type: ignore[misc]
+async def capture_profile(
+    profiler: Annotated[Profiler, Depends(get_profiler)],
+    requests: Annotated[int, Query(gt=0, le=10_000)] = 100,
+    seconds: Annotated[float, Query(gt=0, le=600)] = 30,
+) -> Response:
+    """Endpoint to capture a cProfile trace of the next requests, until `requests` were profiled or `seconds` elapsed.
+
+    The trace is returned as a file in the `pstats` format, which can be loaded with `pstats.Stats` or tools like
+    snakeviz.
+    """
+    try:
+        session = await run_in_threadpool(profiler.profile, requests, seconds)
+    except RuntimeError as error:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(error)) from error
+    return Response(
+        content=session.dump(),
+        media_type="application/octet-stream",
+        headers={
+            "Content-Disposition": 'attachment; filename="profile.pstats"',
+            "X-Profiled-Requests": str(session.profiled_requests),
+        },
+    )
+
+
+class ReloadRequest(BaseModel):
+    """Represent a reload of the translation models, with the languages and pairs to serve and the pairs to refresh.
+
+    Languages and pairs that are not given are read from the current configuration, i.e. the environment and the
+    `.env` file. Pairs are written as "<source>-<target>".
+    """
+
+    source_languages: list[str] | None = None
+    target_languages: list[str] | None = None
+    language_pairs: list[str] | None = None
+    refresh: list[str] = []
+
+
+class ReloadResponse(BaseModel):
+    """Represent the language pairs whose models were added, removed and refreshed by a reload."""
+
+    added: list[str]
+    removed: list[str]
+    refreshed: list[str]
+
+
+@models_router.post("/reload")  # type: ignore[misc]
+async def reload_models(
+    service: Annotated[TranslationService, Depends(get_translation_service)],
+    request: ReloadRequest | None = None,
+) -> ReloadResponse:
+    """Endpoint to load, refresh and unload translation models without restarting the service.
+
+    New models are loaded in the background while the current ones keep serving. If a model fails to load, the current
+    models are kept and the endpoint answers with an error.
+    """
+    request = request or ReloadRequest()
+    try:
+        result = await run_in_threadpool(
+            service.reload_from_config,
+            request.source_languages,
+            request.target_languages,
+            request.language_pairs,
+            request.refresh,
+        )
+    except ValueError as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error)) from error
+    except RuntimeError as error:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(error)) from error
+    return ReloadResponse(**{key: [f"{source}-{target}" for source, target in pairs] for key, pairs in result.items()})
@@ -1,15 +1,18 @@
 """Detection Endpoints.
 
-This module defines the API endpoint for the detection service.
+This module defines the API endpoints for the detection service. Besides the language of a whole text, the segments of a
+text mixing several languages can be detected, which the router uses to forward every segment to its own shard.
 """
 
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
-from api.deps import get_detection_service
+from api.deps import get_detection_service, get_profiler
 from services.detection_service import DetectionService
+from utils.profiling import Profiler
 
 router = APIRouter()
 
@@ -26,11 +29,48 @@ class DetectResponse(BaseModel):
     detected_language: str
 
 
+def _detect(request: DetectRequest, service: DetectionService, profiler: Profiler) -> DetectResponse:
+    """Detect the language of the text of the request."""
+    with profiler.capture():
+        detected_language = service.detect_language(request.text)
+    return DetectResponse(detected_language=detected_language)
+
+
 @router.post("/detect")  # type: ignore[misc]
 async def detect_language(
     request: DetectRequest,
     service: Annotated[DetectionService, Depends(get_detection_service)],
+    profiler: Annotated[Profiler, Depends(get_profiler)],
 ) -> DetectResponse:
     """Detect the language of the given text."""
-    detected_language = service.detect_language(request.text)
-    return DetectResponse(detected_language=detected_language)
+    return await run_in_threadpool(_detect, request, service, profiler)
+
+
+class Segment(BaseModel):
+    """Represent a consecutive segment of a text in a single language."""
+
+    text: str
+    language: str
+
+
+class DetectSegmentsResponse(BaseModel):
+    """Response model for the segment detection endpoint. Joining the texts of the segments yields the original text."""
+
+    segments: list[Segment]
+
+
+def _detect_segments(request: DetectRequest, service: DetectionService, profiler: Profiler) -> DetectSegmentsResponse:
+    """Detect the segments of the text of the request and their languages."""
+    with profiler.capture():
+        segments = service.detect_languages(request.text)
+    return DetectSegmentsResponse(segments=[Segment(text=text, language=language) for text, language in segments])
+
+
+@router.post("/detect/segments")  # type: ignore[misc]
+async def detect_segments(
+    request: DetectRequest,
+    service: Annotated[DetectionService, Depends(get_detection_service)],
+    profiler: Annotated[Profiler, Depends(get_profiler)],
+) -> DetectSegmentsResponse:
+    """Detect the segments of the given text, which may mix several languages, and their languages."""
+    return await run_in_threadpool(_detect_segments, request, service, profiler)
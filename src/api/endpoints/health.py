@@ -0,0 +1,21 @@
+"""Health Endpoints.
+
+This module defines the API endpoint reporting that the service is up, used by the router to check its backends.
+"""
+
+from fastapi import APIRouter
+from pydantic import BaseModel
+
+router = APIRouter()
+
+
+class HealthResponse(BaseModel):
+    """Represent the health status of the service."""
+
+    status: str
+
+
+@router.get("/health")  # type: ignore[misc]
+async def get_health() -> HealthResponse:
+    """Endpoint to check that the service is up."""
+    return HealthResponse(status="ok")
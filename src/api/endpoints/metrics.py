@@ -0,0 +1,41 @@
+"""Metrics Endpoints.
+
+This module defines the API endpoints exposing runtime metrics of the detection and translation services.
+"""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel
+
+from api.deps import get_detection_service, get_translation_service
+from services.detection_service import DetectionService
+from services.translation_service import TranslationService
+
+router = APIRouter()
+
+
+class CoalescingStats(BaseModel):
+    """Represent the number of calls to a service and how many of them were coalesced into an in-flight call."""
+
+    calls: int
+    collapsed: int
+
+
+class CoalescingMetrics(BaseModel):
+    """Represent the request coalescing metrics of the detection and translation services."""
+
+    detection: CoalescingStats
+    translation: CoalescingStats
+
+
+@router.get("/metrics/coalescing")  # type: ignore[misc]
+async def get_coalescing_metrics(
+    service: Annotated[TranslationService, Depends(get_translation_service)],
+    detection_service: Annotated[DetectionService, Depends(get_detection_service)],
+) -> CoalescingMetrics:
+    """Endpoint to get how many detection and translation calls were coalesced into identical in-flight calls."""
+    return CoalescingMetrics(
+        detection=CoalescingStats(**detection_service.get_coalescing_stats()),
+        translation=CoalescingStats(**service.get_coalescing_stats()),
+    )
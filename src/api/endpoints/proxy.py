@@ -0,0 +1,127 @@
+"""Proxy Endpoints.
+
+This module defines the API endpoints of the service in router mode. Translation requests are forwarded to the backend
+instances serving their language pair, and detection requests to any backend.
+"""
+
+import asyncio
+from typing import Annotated
+
+import httpx
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from api.deps import get_config, get_routing_service
+from api.endpoints.detect import DetectRequest, DetectResponse
+from api.endpoints.translate import Language, TranslationRequest, TranslationResponse, get_dominant_language
+from config import AppConfig
+from core.tier_policy import Priority
+from services.routing_service import RoutingService
+from utils.language_utils import get_name_from_code
+
+router = APIRouter()
+
+
+@router.get("/translate/source-languages")  # type: ignore[misc]
+async def get_source_languages(config: Annotated[AppConfig, Depends(get_config)]) -> list[Language]:
+    """Endpoint to get the list of source languages supported by the backends."""
+    return [Language(code=code, name=get_name_from_code(code)) for code in config.source_languages]
+
+
+@router.get("/translate/target-languages")  # type: ignore[misc]
+async def get_target_languages(config: Annotated[AppConfig, Depends(get_config)]) -> list[Language]:
+    """Endpoint to get the list of target languages supported by the backends."""
+    return [Language(code=code, name=get_name_from_code(code)) for code in config.target_languages]
+
+
+@router.post("/detect")  # type: ignore[misc]
+async def detect_language(
+    request: DetectRequest,
+    service: Annotated[RoutingService, Depends(get_routing_service)],
+) -> DetectResponse:
+    """Endpoint to forward a language detection to any backend."""
+    try:
+        response = await service.detect_language(request.text)
+    except ConnectionError as error:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(error)) from error
+    _raise_for_backend_error(response)
+    return DetectResponse.model_validate(response.json())
+
+
+@router.post("/translate")  # type: ignore[misc]
+async def translate_text(
+    request: TranslationRequest,
+    service: Annotated[RoutingService, Depends(get_routing_service)],
+) -> TranslationResponse:
+    """Endpoint to forward a translation to a backend serving its language pair.
+
+    If no source language is given, the segments of the text and their languages are detected by any backend first.
+    Every segment is then forwarded to a backend serving its language pair, like in standalone mode, and the
+    translations are joined.
+    """
+    try:
+        if not request.source_language:
+            detection = await service.detect_segments(request.text)
+            _raise_for_backend_error(detection)
+            segments = [(segment["text"], segment["language"]) for segment in detection.json()["segments"]]
+            detected_language = get_dominant_language(segments)
+            translation = await _translate_segments(service, segments, request.target_language, request.priority)
+        else:
+            detected_language = None
+            translation = await _translate_segment(
+                service,
+                request.text,
+                request.source_language,
+                request.target_language,
+                request.priority,
+            )
+    except LookupError as error:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(error)) from error
+    except ConnectionError as error:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(error)) from error
+    return TranslationResponse(detected_language=detected_language, translation=translation)
+
+
+async def _translate_segments(
+    service: RoutingService,
+    segments: list[tuple[str, str]],
+    target_language: str,
+    priority: Priority,
+) -> str:
+    """Translate the segments concurrently on the backends of their language pairs and join the translations.
+
+    Segments already in the target language are kept as they are. Whitespace surrounding the segments is preserved.
+    """
+
+    async def translate(text: str, source_language: str) -> str:
+        if source_language == target_language or not text.strip():
+            return text
+        translation = await _translate_segment(service, text.strip(), source_language, target_language, priority)
+        leading_whitespace = text[: len(text) - len(text.lstrip())]
+        trailing_whitespace = text[len(text.rstrip()) :]
+        return f"{leading_whitespace}{translation}{trailing_whitespace}"
+
+    return "".join(await asyncio.gather(*(translate(text, language) for text, language in segments)))
+
+
+async def _translate_segment(
+    service: RoutingService,
+    text: str,
+    source_language: str,
+    target_language: str,
+    priority: Priority,
+) -> str:
+    """Translate a text on a backend serving its language pair."""
+    response = await service.translate(text, source_language, target_language, priority)
+    _raise_for_backend_error(response)
+    return TranslationResponse.model_validate(response.json()).translation
+
+
+def _raise_for_backend_error(response: httpx.Response) -> None:
+    """Pass an error response of a backend through to the client."""
+    if response.is_success:
+        return
+    try:
+        detail = response.json().get("detail")
+    except ValueError:
+        detail = response.text
+    raise HTTPException(status_code=response.status_code, detail=detail)
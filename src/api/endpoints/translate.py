@@ -1,17 +1,24 @@
 """Translation Endpoints.
 
-This module defines the API endpoints for the translation service.
+This module defines the API endpoints for the translation service. Besides the plain HTTP endpoints, a WebSocket channel
+allows high-rate clients to keep one connection open and pipeline tagged translation requests over it.
 """
 
+import asyncio
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, status
+from fastapi.concurrency import run_in_threadpool
+from loguru import logger
+from pydantic import BaseModel, ValidationError
 
-from api.deps import get_detection_service, get_translation_service
+from api.deps import get_config, get_detection_service, get_profiler, get_translation_service
+from config import AppConfig
+from core.tier_policy import Priority
 from services.detection_service import DetectionService
 from services.translation_service import TranslationService
 from utils.language_utils import get_name_from_code
+from utils.profiling import Profiler
 
 router = APIRouter()
 
@@ -44,11 +51,17 @@ async def get_target_languages(
 
 
 class TranslationRequest(BaseModel):
-    """Represent a translation request with the text to be translated and the source and target languages."""
+    """Represent a translation request with the text to be translated and the source and target languages.
+
+    The priority trades quality for latency: high priority requests are always served by the full model, low priority
+    requests by the fast model if there is one, and normal priority requests by the fast model if they are short or the
+    translator is busy.
+    """
 
     text: str
     source_language: str
     target_language: str
+    priority: Priority = "normal"
 
 
 class TranslationResponse(BaseModel):
@@ -58,18 +71,133 @@ class TranslationResponse(BaseModel):
     translation: str
 
 
+class WebSocketTranslationRequest(TranslationRequest):
+    """Represent a translation request sent over the WebSocket channel, tagged with a client-chosen identifier."""
+
+    id: str | int
+
+
+class WebSocketTranslationResponse(TranslationResponse):
+    """Represent a translation response sent over the WebSocket channel, tagged with the identifier of its request."""
+
+    id: str | int
+
+
+class WebSocketErrorResponse(BaseModel):
+    """Represent a failed WebSocket request, tagged with the identifier of its request if it could be parsed."""
+
+    id: str | int | None
+    error: str
+
+
+def get_dominant_language(segments: list[tuple[str, str]]) -> str:
+    """Get the language covering the largest part of the text."""
+    lengths: dict[str, int] = {}
+    for text, language in segments:
+        lengths[language] = lengths.get(language, 0) + len(text.strip())
+    return max(lengths, key=lambda language: lengths[language])
+
+
+def _translate(
+    request: TranslationRequest,
+    service: TranslationService,
+    detection_service: DetectionService,
+    profiler: Profiler,
+) -> TranslationResponse:
+    """Translate the text of the request, detecting the source language of every segment if it is not given."""
+    with profiler.capture():
+        if not request.source_language:
+            segments = detection_service.detect_languages(request.text)
+            detected_language = get_dominant_language(segments)
+            translation = service.translate_segments(segments, request.target_language, request.priority)
+        else:
+            detected_language = None
+            translation = service.translate(
+                request.text,
+                request.source_language,
+                request.target_language,
+                request.priority,
+            )
+    return TranslationResponse(detected_language=detected_language, translation=translation)
+
+
 @router.post("/translate")  # type: ignore[misc]
 async def translate_text(
     request: TranslationRequest,
     service: Annotated[TranslationService, Depends(get_translation_service)],
     detection_service: Annotated[DetectionService, Depends(get_detection_service)],
+    profiler: Annotated[Profiler, Depends(get_profiler)],
 ) -> TranslationResponse:
     """Endpoint to translate text from a source language to a target language."""
-    if not request.source_language:
-        detected_language = detection_service.detect_language(request.text)
-        source_language = detected_language
-    else:
-        detected_language = None
-        source_language = request.source_language
-    translation = service.translate(request.text, source_language, request.target_language)
-    return TranslationResponse(detected_language=detected_language, translation=translation)
+    return await run_in_threadpool(_translate, request, service, detection_service, profiler)
+
+
+async def _receive_request(websocket: WebSocket) -> WebSocketTranslationRequest | WebSocketErrorResponse:
+    """Receive the next request of the WebSocket, or the error response to send if it is not a valid text message.
+
+    Raises:
+        WebSocketDisconnect: If the client disconnected.
+    """
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", status.WS_1000_NORMAL_CLOSURE))
+    if message.get("text") is None:
+        return WebSocketErrorResponse(id=None, error="Invalid request: only text messages are supported")
+    try:
+        return WebSocketTranslationRequest.model_validate_json(message["text"])
+    except ValidationError as error:
+        return WebSocketErrorResponse(id=None, error=f"Invalid request: {error}")
+
+
+@router.websocket("/ws/translate")  # type: ignore[misc]
+async def translate_websocket(
+    websocket: WebSocket,
+    service: Annotated[TranslationService, Depends(get_translation_service)],
+    detection_service: Annotated[DetectionService, Depends(get_detection_service)],
+    profiler: Annotated[Profiler, Depends(get_profiler)],
+    config: Annotated[AppConfig, Depends(get_config)],
+) -> None:
+    """WebSocket endpoint to translate a stream of tagged requests over a single connection.
+
+    Every message is a JSON encoded translation request with an additional `id` field. Requests are processed
+    concurrently and their responses are sent back as soon as they complete, so they may arrive out of order. At most
+    `websocket_max_in_flight` requests are processed at once per connection; further messages are read once a slot
+    becomes free. Binary messages are answered with an error. Pending requests are cancelled when the connection ends.
+    """
+    await websocket.accept()
+    send_lock = asyncio.Lock()
+    in_flight = asyncio.Semaphore(config.websocket_max_in_flight)
+    tasks: set[asyncio.Task[None]] = set()
+
+    async def send(message: BaseModel) -> None:
+        async with send_lock:
+            await websocket.send_text(message.model_dump_json())
+
+    async def handle(request: WebSocketTranslationRequest) -> None:
+        try:
+            response = await run_in_threadpool(_translate, request, service, detection_service, profiler)
+        except ValueError as error:
+            await send(WebSocketErrorResponse(id=request.id, error=str(error)))
+        except Exception:  # noqa: BLE001
+            logger.exception(f"Could not process WebSocket translation request {request.id}")
+            await send(WebSocketErrorResponse(id=request.id, error="Translation failed"))
+        else:
+            await send(WebSocketTranslationResponse(id=request.id, **response.model_dump()))
+        finally:
+            in_flight.release()
+
+    try:
+        while True:
+            request = await _receive_request(websocket)
+            if isinstance(request, WebSocketErrorResponse):
+                await send(request)
+                continue
+            await in_flight.acquire()
+            task = asyncio.create_task(handle(request))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+    except WebSocketDisconnect:
+        logger.debug(f"WebSocket client disconnected, cancelling {len(tasks)} pending requests")
+    finally:
+        for task in list(tasks):
+            task.cancel()
@@ -0,0 +1,76 @@
+"""Middleware Module.
+
+This module defines the ASGI middleware that reports per-request timing breakdowns and logs slow requests.
+"""
+
+import random
+import secrets
+import time
+
+from loguru import logger
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from utils.profiling import collect_timings, format_server_timing
+
+
+class ProfilingMiddleware:
+    """Middleware timing requests, returning their breakdown in a `Server-Timing` header and logging slow requests.
+
+    A timing breakdown is returned for a random sample of requests and for requests sending an `X-Debug-Timing` header
+    together with a valid `X-Admin-Token` header. Requests taking longer than the slow request threshold are logged
+    with their route and input size.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = 0.0,
+        slow_request_threshold_ms: float | None = None,
+        admin_token: str | None = None,
+    ) -> None:
+        """Initialize the ProfilingMiddleware with the sample rate, the slow request threshold and the admin token."""
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow_request_threshold_ms = slow_request_threshold_ms
+        self.admin_token = admin_token
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process the request, timing it if it is sampled or slow requests are logged."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        sampled = self._is_sampled(headers)
+        if not sampled and self.slow_request_threshold_ms is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        with collect_timings() as timings:
+
+            async def send_with_timings(message: Message) -> None:
+                if sampled and message["type"] == "http.response.start":
+                    timings["total"] = (time.perf_counter() - start) * 1000
+                    MutableHeaders(scope=message).append("Server-Timing", format_server_timing(timings))
+                await send(message)
+
+            await self.app(scope, receive, send_with_timings)
+
+        duration = (time.perf_counter() - start) * 1000
+        if self.slow_request_threshold_ms is not None and duration >= self.slow_request_threshold_ms:
+            logger.warning(
+                "Slow request: {} {} took {:.1f} ms (input size: {} bytes, timings: {})",
+                scope["method"],
+                scope["path"],
+                duration,
+                headers.get("content-length", "unknown"),
+                format_server_timing(timings),
+            )
+
+    def _is_sampled(self, headers: Headers) -> bool:
+        """Check whether a timing breakdown should be returned for the request."""
+        if self.admin_token is not None and "x-debug-timing" in headers:
+            return secrets.compare_digest(headers.get("x-admin-token", ""), self.admin_token)
+        return self.sample_rate > 0 and random.random() < self.sample_rate  # noqa: S311
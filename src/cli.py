@@ -0,0 +1,105 @@
+"""CLI.
+
+This module provides a command line entry point for translating large JSON Lines, CSV and gettext PO files offline,
+without going through the HTTP API. The languages of the models are taken from the application configuration.
+
+Example:
+    python src/cli.py messages.jsonl messages.en.jsonl --target-language en --workers 4
+"""
+
+import argparse
+from pathlib import Path
+
+from config import AppConfig
+from services.bulk_translation_service import BulkTranslationService
+from utils.file_formats import CsvFile, JsonlFile, PoFile, TranslationFile
+
+FILE_FORMATS = {".jsonl": "jsonl", ".csv": "csv", ".po": "po"}
+
+
+def positive_int(value: str) -> int:
+    """Convert a command line argument to a positive integer.
+
+    Raises:
+        argparse.ArgumentTypeError: If the argument is not a positive integer.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number <= 0:
+        msg = f"{value!r} is not a positive integer"
+        raise argparse.ArgumentTypeError(msg)
+    return number
+
+
+def parse_args(args: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description="Translate JSON Lines, CSV and gettext PO files offline.")
+    parser.add_argument("input", type=Path, help="file to translate")
+    parser.add_argument("output", type=Path, help="file to write the translations to, in the same format")
+    parser.add_argument("--format", choices=sorted(FILE_FORMATS.values()), help="file format, by default its suffix")
+    parser.add_argument("--source-language", default="", help="source language, detected per text if not given")
+    parser.add_argument("--target-language", required=True, help="target language")
+    parser.add_argument("--field", default="text", help="JSON field or CSV column containing the text")
+    parser.add_argument("--output-field", default="translation", help="JSON field or CSV column for the translation")
+    parser.add_argument("--workers", type=positive_int, default=1, help="number of processes, each with its own models")
+    parser.add_argument("--chunk-size", type=positive_int, default=256, help="number of records per chunk of work")
+    parser.add_argument("--batch-size", type=positive_int, default=32, help="number of texts per model call")
+    parser.add_argument("--resume", action="store_true", help="resume from the checkpoint of an interrupted run")
+    return parser.parse_args(args)
+
+
+def create_translation_file(args: argparse.Namespace) -> TranslationFile:
+    """Create the reader and writer of the input and output file from the command line arguments.
+
+    Raises:
+        ValueError: If the file format is not given and cannot be derived from the suffix of the input file.
+    """
+    file_format = args.format or FILE_FORMATS.get(args.input.suffix.lower())
+    if file_format == "jsonl":
+        return JsonlFile(
+            args.input,
+            args.output,
+            args.source_language,
+            args.target_language,
+            field=args.field,
+            output_field=args.output_field,
+        )
+    if file_format == "csv":
+        return CsvFile(
+            args.input,
+            args.output,
+            args.source_language,
+            args.target_language,
+            field=args.field,
+            output_field=args.output_field,
+        )
+    if file_format == "po":
+        return PoFile(args.input, args.output, args.source_language, args.target_language)
+
+    msg = f"Unknown file format of {args.input}, use --format to specify it"
+    raise ValueError(msg)
+
+
+def main(args: list[str] | None = None) -> None:
+    """Translate the input file given on the command line."""
+    parsed_args = parse_args(args)
+    config = AppConfig()
+    service = BulkTranslationService(
+        config.source_languages,
+        config.target_languages,
+        config.get_language_pairs(),
+        workers=parsed_args.workers,
+    )
+    service.translate_file(
+        create_translation_file(parsed_args),
+        parsed_args.output.with_name(f"{parsed_args.output.name}.checkpoint"),
+        chunk_size=parsed_args.chunk_size,
+        batch_size=parsed_args.batch_size,
+        resume=parsed_args.resume,
+    )
+
+
+if __name__ == "__main__":
+    main()
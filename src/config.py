@@ -3,8 +3,22 @@
 This module contains the configuration settings for the translation service application.
 """
 
+from typing import Literal
+
+from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from utils.language_utils import parse_language_pair
+
+DEFAULT_MODEL_NAME = "Helsinki-NLP/opus-mt-{source}-{target}"
+
+
+class BackendConfig(BaseModel):
+    """Configuration of a backend instance the router forwards requests to."""
+
+    url: str
+    weight: int = Field(default=1, gt=0)
+
 
 class AppConfig(BaseSettings):  # type: ignore[misc]
     """Configuration settings for the translation service application."""
@@ -12,7 +26,33 @@ class AppConfig(BaseSettings):  # type: ignore[misc]
     source_languages: list[str] = ["de", "en", "es", "fr", "it", "ja", "ko", "pl", "ru", "sk", "tr", "zh"]
     target_languages: list[str] = ["de", "en", "es", "fr", "it"]
 
+    language_pairs: list[str] | None = None
+
     host: str = "0.0.0.0"  # noqa: S104
     port: int = 8000
 
+    mode: Literal["standalone", "router"] = "standalone"
+    shard_map: dict[str, list[BackendConfig]] = {}
+    router_timeout: float = 30.0
+    router_max_connections: int = 100
+    router_health_check_interval: float = 5.0
+
+    websocket_max_in_flight: int = Field(default=32, gt=0)
+
+    admin_token: str | None = None
+    profiling_sample_rate: float = 0.0
+    slow_request_threshold_ms: float | None = None
+
+    fast_tier_enabled: bool = False
+    fast_tier_model: str = DEFAULT_MODEL_NAME
+    fast_tier_quantize: bool = True
+    fast_tier_max_tokens: int = 16
+    fast_tier_queue_depth: int = 4
+
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    def get_language_pairs(self) -> list[tuple[str, str]] | None:
+        """Get the language pairs to create translation models for, or None for all source and target combinations."""
+        if self.language_pairs is None:
+            return None
+        return [parse_language_pair(pair) for pair in self.language_pairs]
@@ -3,7 +3,17 @@
 This module provides a class for detecting the language of a given text using the Lingua library.
 """
 
-from lingua import Language, LanguageDetectorBuilder
+import re
+from itertools import pairwise
+
+from lingua import ConfidenceValue, Language, LanguageDetectorBuilder
+
+from utils.profiling import timed
+
+SENTENCE_BOUNDARY = re.compile(r"[.!?]+\s+|[\u3002\uff01\uff1f]+\s*|\n\s*")
+MIN_TEXT_CONFIDENCE = 0.9
+MIN_SENTENCE_LENGTH = 10
+LANGUAGE_SWITCH_RATIO = 2.0
 
 
 class Detector:
@@ -37,5 +47,82 @@ class Detector:
             ValueError: If the input text is empty or contains only whitespace.
             DetectionError: If the language of the given text could not be detected.
         """
-        detected_language = self.detector.detect_language_of(text)
+        with timed("detect"):
+            detected_language = self.detector.detect_language_of(text)
         return str(detected_language.iso_code_639_1.name.lower())
+
+    def detect_languages(self, text: str) -> list[tuple[str, str]]:
+        """Splits the given text into sentences, detects their languages and merges consecutive ones of equal language.
+
+        The text is only split if the language of the whole text is not detected confidently. A sentence only starts a
+        segment of another language if it is long enough and that language is clearly more likely than the language of
+        the whole text. Other sentences keep the language of the whole text, or, if they are too short, join the
+        preceding segment, so that abbreviations and interjections do not break up single-language text.
+
+        Args:
+            text (str): The text, which may contain several languages, for which the languages need to be detected.
+
+        Returns:
+            list[tuple[str, str]]: The consecutive segments of the text, together with the ISO 639-1 code of their
+                language in lowercase. Joining the segments yields the original text.
+        """
+        boundaries = [0, *(match.end() for match in SENTENCE_BOUNDARY.finditer(text.rstrip())), len(text)]
+        sentences = [text[start:end] for start, end in pairwise(boundaries) if start < end]
+        if len(sentences) <= 1:
+            return [(text, self.detect_language(text))]
+
+        with timed("detect"):
+            confidence_values = self.detector.compute_language_confidence_values(text)
+        if not confidence_values or confidence_values[0].value == 0:
+            return [(text, self.detect_language(text))]
+        text_language = confidence_values[0].language
+        if confidence_values[0].value >= MIN_TEXT_CONFIDENCE:
+            return [(text, _get_code(text_language))]
+
+        with timed("detect"):
+            sentence_confidence_values = self.detector.compute_language_confidence_values_in_parallel(sentences)
+
+        segments: list[tuple[str, str]] = []
+        pending = ""
+        for sentence, values in zip(sentences, sentence_confidence_values, strict=True):
+            detected_language = _get_sentence_language(sentence, values, text_language)
+            if detected_language is None:
+                pending += sentence
+                continue
+            language = _get_code(detected_language)
+            if segments and segments[-1][1] == language:
+                segments[-1] = (segments[-1][0] + pending + sentence, language)
+            elif segments:
+                segments[-1] = (segments[-1][0] + pending, segments[-1][1])
+                segments.append((sentence, language))
+            else:
+                segments.append((pending + sentence, language))
+            pending = ""
+
+        if not segments:
+            return [(text, _get_code(text_language))]
+        segments[-1] = (segments[-1][0] + pending, segments[-1][1])
+        return segments
+
+
+def _get_code(language: Language) -> str:
+    """Get the ISO 639-1 code of the language in lowercase."""
+    return str(language.iso_code_639_1.name.lower())
+
+
+def _get_sentence_language(
+    sentence: str,
+    confidence_values: list[ConfidenceValue],
+    text_language: Language,
+) -> Language | None:
+    """Get the language of a sentence of a text, or None if the sentence is too short to tell."""
+    if len(sentence.strip()) < MIN_SENTENCE_LENGTH or not confidence_values:
+        return None
+    sentence_language = confidence_values[0].language
+    text_language_confidence = next(
+        (value.value for value in confidence_values if value.language == text_language),
+        0.0,
+    )
+    if confidence_values[0].value >= LANGUAGE_SWITCH_RATIO * text_language_confidence:
+        return sentence_language
+    return text_language
@@ -0,0 +1,79 @@
+"""Shard Router.
+
+This module provides the ShardRouter class, which maps language pairs to the backend instances serving them and picks
+the backends to forward a request to.
+"""
+
+import random
+
+from loguru import logger
+
+DEFAULT_SHARD = "*"
+
+
+class Backend:
+    """A backend instance serving translations for some language pairs, whose health is shared between its shards."""
+
+    def __init__(self, url: str) -> None:
+        """Initialize the Backend with its base URL."""
+        self.url = url.rstrip("/")
+        self.healthy = True
+
+
+class ShardRouter:
+    """ShardRouter class for selecting the backend instances serving a language pair.
+
+    The shard map maps language pairs written as "<source>-<target>" to the backends serving them. Pairs without an
+    entry are served by the backends of the "*" shard, if any. Backends are ordered by weighted random choice among the
+    healthy replicas, followed by the unhealthy ones as a last resort. The weight of a backend is given per shard, so a
+    backend can be a hot replica of one pair and a fallback of another.
+    """
+
+    def __init__(self, shard_map: dict[str, list[tuple[str, int]]]) -> None:
+        """Initialize the ShardRouter with a shard map of language pairs to backend URLs and weights."""
+        self.backends: dict[str, Backend] = {}
+        self.shards: dict[str, list[tuple[Backend, int]]] = {}
+        for pair, replicas in shard_map.items():
+            self.shards[pair] = [(self._get_or_create_backend(url), weight) for url, weight in replicas]
+
+    def _get_or_create_backend(self, url: str) -> Backend:
+        """Get the backend with the given URL, so that its health is shared between the shards it serves."""
+        backend = self.backends.get(url.rstrip("/"))
+        if backend is None:
+            backend = Backend(url)
+            self.backends[backend.url] = backend
+        return backend
+
+    def get_backends(self, source_language: str, target_language: str) -> list[Backend]:
+        """Get the backends serving the language pair, in the order in which they should be tried.
+
+        Raises:
+            LookupError: If no backend serves the language pair.
+        """
+        replicas = self.shards.get(f"{source_language}-{target_language}") or self.shards.get(DEFAULT_SHARD)
+        if not replicas:
+            msg = f"No backend serves the language pair {source_language}-{target_language}"
+            raise LookupError(msg)
+        return self._order_by_weight_and_health(replicas)
+
+    def get_all_backends(self) -> list[Backend]:
+        """Get all backends, in the order in which they should be tried."""
+        return self._order_by_weight_and_health([(backend, 1) for backend in self.backends.values()])
+
+    def mark_healthy(self, backend: Backend) -> None:
+        """Mark the backend as healthy."""
+        if not backend.healthy:
+            logger.info(f"Backend {backend.url} is healthy again")
+        backend.healthy = True
+
+    def mark_unhealthy(self, backend: Backend) -> None:
+        """Mark the backend as unhealthy, so that it is only tried after all healthy replicas."""
+        if backend.healthy:
+            logger.warning(f"Backend {backend.url} is unhealthy")
+        backend.healthy = False
+
+    @staticmethod
+    def _order_by_weight_and_health(replicas: list[tuple[Backend, int]]) -> list[Backend]:
+        """Shuffle the backends weighted by their weight and move unhealthy ones to the end."""
+        ordered = sorted(replicas, key=lambda replica: (not replica[0].healthy, -(random.random() ** (1 / replica[1]))))  # noqa: S311
+        return [backend for backend, _ in ordered]
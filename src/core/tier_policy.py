@@ -0,0 +1,51 @@
+"""Tier Policy.
+
+This module provides the TierPolicy class, which decides whether a translation is served by the fast model tier or by
+the full model tier of its language pair.
+"""
+
+from typing import Literal
+
+from config import DEFAULT_MODEL_NAME
+
+Priority = Literal["low", "normal", "high"]
+Tier = Literal["fast", "full"]
+
+
+class TierPolicy:
+    """TierPolicy class for routing translations between a fast and a full model tier.
+
+    High priority translations always use the full tier, so that quality is kept where it matters, and low priority
+    translations always use the fast tier. Normal priority translations use the fast tier if the input is short, or if
+    the number of translations in progress reaches the queue depth threshold, so that the service degrades to the
+    faster tier under load instead of queueing.
+    """
+
+    def __init__(
+        self,
+        max_fast_tokens: int = 16,
+        queue_depth_threshold: int = 4,
+        fast_model_name: str = DEFAULT_MODEL_NAME,
+        *,
+        quantize_fast_model: bool = True,
+    ) -> None:
+        """Initialize the TierPolicy with its thresholds and the model of the fast tier.
+
+        Args:
+            max_fast_tokens (int): The maximum number of input tokens translated by the fast tier at normal priority.
+            queue_depth_threshold (int): The number of translations in progress from which the fast tier is used.
+            fast_model_name (str): The name of the fast tier model, with "{source}" and "{target}" placeholders.
+            quantize_fast_model (bool): Whether to quantize the fast tier model to 8-bit integer weights.
+        """
+        self.max_fast_tokens = max_fast_tokens
+        self.queue_depth_threshold = queue_depth_threshold
+        self.fast_model_name = fast_model_name
+        self.quantize_fast_model = quantize_fast_model
+
+    def select_tier(self, token_count: int, priority: Priority, queue_depth: int) -> Tier:
+        """Select the tier for a translation of the given number of tokens, priority and current queue depth."""
+        if priority == "high":
+            return "full"
+        if priority == "low" or token_count <= self.max_fast_tokens or queue_depth >= self.queue_depth_threshold:
+            return "fast"
+        return "full"
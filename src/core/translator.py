@@ -3,29 +3,57 @@
 This module provides a Translator class for translating text between multiple languages.
 """
 
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from itertools import product
 
 from langcodes import Language
 from loguru import logger
 
+from core.tier_policy import Priority, TierPolicy
 from core.translator_model import TranslatorModel
+from utils.profiling import timed
+
+MULTI_LANGUAGE_TO_ENGLISH = ("mul", "en")
+ENGLISH_TO_MULTI_LANGUAGE = ("en", "mul")
 
 
 class Translator:
     """Translator class for translating text between multiple languages."""
 
-    def __init__(self, source_languages: list[str], target_languages: list[str]) -> None:
-        """Initialize the Translator with source and target languages."""
+    def __init__(
+        self,
+        source_languages: list[str],
+        target_languages: list[str],
+        language_pairs: list[tuple[str, str]] | None = None,
+        tier_policy: TierPolicy | None = None,
+    ) -> None:
+        """Initialize the Translator with source and target languages.
+
+        If language pairs are given, direct translation models are only created for these pairs instead of for every
+        combination of source and target languages. Other pairs are translated with the multi-language models. If a
+        tier policy is given, a fast model is created for every direct pair besides the full model, and the policy
+        selects which of them serves a translation.
+        """
         self.source_languages = source_languages
         self.target_languages = target_languages
-        self._create_translation_models(source_languages, target_languages)
-        self.multi_language_to_english_model = TranslatorModel("mul", "en")
-        self.english_to_multi_language_model = TranslatorModel("en", "mul")
+        self.tier_policy = tier_policy
+        self._in_flight = 0
+        self._in_flight_lock = threading.Lock()
+        if language_pairs is None:
+            language_pairs = list(product(source_languages, target_languages))
+        self._create_translation_models(language_pairs)
+        self.multi_language_to_english_model = TranslatorModel(*MULTI_LANGUAGE_TO_ENGLISH)
+        self.english_to_multi_language_model = TranslatorModel(*ENGLISH_TO_MULTI_LANGUAGE)
+        self._reload_lock = threading.Lock()
 
-    def _create_translation_models(self, source_languages: list[str], target_languages: list[str]) -> None:
+    def _create_translation_models(self, language_pairs: list[tuple[str, str]]) -> None:
         """Create translation models for each source-target language pair."""
-        self.models = {}
-        for source_language, target_language in product(source_languages, target_languages):
+        self.models: dict[tuple[str, str], TranslatorModel] = {}
+        self.fast_models: dict[tuple[str, str], TranslatorModel] = {}
+        self.unavailable_pairs: set[tuple[str, str]] = set()
+        for source_language, target_language in language_pairs:
             if source_language != target_language:
                 try:
                     self.models[(source_language, target_language)] = TranslatorModel(source_language, target_language)
@@ -33,6 +61,95 @@ class Translator:
                     logger.warning(
                         f"Could not create translation model for {source_language} to {target_language}",
                     )
+                    self.unavailable_pairs.add((source_language, target_language))
+                    continue
+                fast_model = self._create_fast_model(source_language, target_language)
+                if fast_model is not None:
+                    self.fast_models[(source_language, target_language)] = fast_model
+
+    def _create_fast_model(self, source_language: str, target_language: str) -> TranslatorModel | None:
+        """Create the fast tier model for the language pair, if a tier policy is configured and the model exists."""
+        if self.tier_policy is None:
+            return None
+        try:
+            return TranslatorModel(
+                source_language,
+                target_language,
+                self.tier_policy.fast_model_name,
+                quantize=self.tier_policy.quantize_fast_model,
+                greedy=True,
+            )
+        except OSError:
+            logger.warning(f"Could not create fast translation model for {source_language} to {target_language}")
+            return None
+
+    def reload(
+        self,
+        source_languages: list[str],
+        target_languages: list[str],
+        language_pairs: list[tuple[str, str]] | None = None,
+        refresh_pairs: list[tuple[str, str]] | None = None,
+    ) -> dict[str, list[tuple[str, str]]]:
+        """Reload the translation models for new languages or model versions without interrupting translations.
+
+        The desired language pairs are compared with the loaded models. Models for new pairs and for the pairs to
+        refresh, which may include the multi-language pairs ("mul", "en") and ("en", "mul"), are loaded while the
+        current models keep serving. The routing is then swapped at once. Translations still running on a removed or
+        replaced model finish on it, and the model is freed when the last of them completes. Pairs whose model could not
+        be created at startup are only retried if they are refreshed explicitly.
+
+        Returns:
+            dict[str, list[tuple[str, str]]]: The added, removed and refreshed language pairs.
+
+        Raises:
+            RuntimeError: If a model could not be loaded. The current models are kept in that case.
+        """
+        with self._reload_lock:
+            if language_pairs is None:
+                language_pairs = list(product(source_languages, target_languages))
+            desired_pairs = {pair for pair in language_pairs if pair[0] != pair[1]}
+            refresh = set(refresh_pairs or [])
+            added_pairs = desired_pairs - set(self.models) - self.unavailable_pairs
+            refreshed_pairs = (desired_pairs & refresh) - added_pairs
+            refreshed_pairs |= refresh & {MULTI_LANGUAGE_TO_ENGLISH, ENGLISH_TO_MULTI_LANGUAGE}
+            removed_pairs = set(self.models) - desired_pairs
+
+            loaded_models = {}
+            for pair in sorted(added_pairs | refreshed_pairs):
+                try:
+                    loaded_models[pair] = TranslatorModel(*pair)
+                except Exception as error:
+                    msg = f"Could not load translation model for {pair[0]} to {pair[1]}, keeping the current models"
+                    logger.error(msg)
+                    raise RuntimeError(msg) from error
+
+            fast_models = {
+                pair: model
+                for pair, model in self.fast_models.items()
+                if pair in desired_pairs and pair not in loaded_models
+            }
+            for pair in loaded_models.keys() & desired_pairs:
+                fast_model = self._create_fast_model(*pair)
+                if fast_model is not None:
+                    fast_models[pair] = fast_model
+
+            models = {pair: model for pair, model in self.models.items() if pair in desired_pairs}
+            models.update({pair: model for pair, model in loaded_models.items() if pair in desired_pairs})
+            self.models = models
+            self.fast_models = fast_models
+            self.unavailable_pairs = (self.unavailable_pairs & desired_pairs) - set(loaded_models)
+            if MULTI_LANGUAGE_TO_ENGLISH in loaded_models:
+                self.multi_language_to_english_model = loaded_models[MULTI_LANGUAGE_TO_ENGLISH]
+            if ENGLISH_TO_MULTI_LANGUAGE in loaded_models:
+                self.english_to_multi_language_model = loaded_models[ENGLISH_TO_MULTI_LANGUAGE]
+            self.source_languages = source_languages
+            self.target_languages = target_languages
+
+        logger.info(
+            f"Reloaded translation models: added {sorted(added_pairs)}, removed {sorted(removed_pairs)}, "
+            f"refreshed {sorted(refreshed_pairs)}",
+        )
+        return {"added": sorted(added_pairs), "removed": sorted(removed_pairs), "refreshed": sorted(refreshed_pairs)}
 
     def get_source_languages(self) -> list[str]:
         """Get the list of source languages."""
@@ -42,24 +159,99 @@ class Translator:
         """Get the list of target languages."""
         return self.target_languages
 
-    def translate(self, text: str, source_language: str, target_language: str) -> str:
-        """Translate text from source language to target language."""
+    def translate(self, text: str, source_language: str, target_language: str, priority: Priority = "normal") -> str:
+        """Translate text from source language to target language.
+
+        The priority is used by the tier policy, if any, to select between the fast and the full model of the pair.
+        """
         self._validate_input(text, source_language, target_language)
 
-        if source_language == target_language:
-            logger.debug("Text is already in the target language")
-            translation = text
-        elif (source_language, target_language) in self.models:
-            translation = self._direct_translation(text, source_language, target_language)
-        elif source_language == "en":
-            translation = self._english_to_multi_language_translation(text, target_language)
-        elif target_language == "en":
-            translation = self._multi_language_to_english_translation(text, source_language)
-        else:
-            translation = self._multi_step_translation(text, source_language, target_language)
+        with self._track_in_flight() as queue_depth, timed("translate"):
+            model = self._select_model([text], source_language, target_language, priority, queue_depth)
+            if source_language == target_language:
+                logger.debug("Text is already in the target language")
+                translation = text
+            elif model is not None:
+                translation = self._direct_translation(text, model, source_language, target_language)
+            elif source_language == "en":
+                translation = self._english_to_multi_language_translation(text, target_language)
+            elif target_language == "en":
+                translation = self._multi_language_to_english_translation(text, source_language)
+            else:
+                translation = self._multi_step_translation(text, source_language, target_language)
 
         return translation
 
+    def translate_batch(
+        self,
+        texts: list[str],
+        source_language: str,
+        target_language: str,
+        priority: Priority = "normal",
+    ) -> list[str]:
+        """Translate several texts from source language to target language with a single call per model."""
+        for text in texts:
+            self._validate_input(text, source_language, target_language)
+
+        with self._track_in_flight() as queue_depth, timed("translate"):
+            model = self._select_model(texts, source_language, target_language, priority, queue_depth)
+            if source_language == target_language:
+                logger.debug("Texts are already in the target language")
+                translations = list(texts)
+            elif model is not None:
+                logger.debug("Using model for batch translation: {}", (source_language, target_language))
+                translations = model.translate_batch(texts)
+            elif source_language == "en":
+                logger.debug("Using English to multi-language model for batch translation")
+                translations = self._english_to_multi_language_batch_translation(texts, target_language)
+            elif target_language == "en":
+                logger.debug("Using multi-language to English model for batch translation")
+                translations = self.multi_language_to_english_model.translate_batch(
+                    texts,
+                    source_language=source_language,
+                )
+            else:
+                logger.debug("Using multi-language to English and English to multi-language models for batch")
+                english_translations = self.multi_language_to_english_model.translate_batch(
+                    texts,
+                    source_language=source_language,
+                )
+                translations = self._english_to_multi_language_batch_translation(english_translations, target_language)
+
+        return translations
+
+    @contextmanager
+    def _track_in_flight(self) -> Iterator[int]:
+        """Count the enclosed translation as in flight and provide the number of other translations in flight."""
+        with self._in_flight_lock:
+            queue_depth = self._in_flight
+            self._in_flight += 1
+        try:
+            yield queue_depth
+        finally:
+            with self._in_flight_lock:
+                self._in_flight -= 1
+
+    def _select_model(
+        self,
+        texts: list[str],
+        source_language: str,
+        target_language: str,
+        priority: Priority,
+        queue_depth: int,
+    ) -> TranslatorModel | None:
+        """Select the tier of the direct translation model of the language pair, if there is such a model."""
+        model = self.models.get((source_language, target_language))
+        fast_model = self.fast_models.get((source_language, target_language))
+        if model is None or fast_model is None or self.tier_policy is None:
+            return model
+
+        # Only normal priority depends on the input length, so the texts are not tokenized for other priorities.
+        token_count = max(model.count_tokens(text) for text in texts) if priority == "normal" else 0
+        tier = self.tier_policy.select_tier(token_count, priority, queue_depth)
+        logger.debug(f"Using {tier} tier at {priority} priority and queue depth {queue_depth}")
+        return fast_model if tier == "fast" else model
+
     def _validate_input(self, text: str, source_language: str, target_language: str) -> None:
         """Validate the input parameters for translation."""
         if not text.strip():
@@ -77,10 +269,15 @@ class Translator:
             logger.error(msg)
             raise ValueError(msg)
 
-    def _direct_translation(self, text: str, source_language: str, target_language: str) -> str:
-        """Perform direct translation using the model."""
+    def _direct_translation(
+        self,
+        text: str,
+        model: TranslatorModel,
+        source_language: str,
+        target_language: str,
+    ) -> str:
+        """Perform direct translation using the model of the language pair."""
         logger.debug("Using model for translation: {}", (source_language, target_language))
-        model = self.models[(source_language, target_language)]
         return model.translate(text)
 
     def _english_to_multi_language_translation(self, text: str, target_language: str) -> str:
@@ -108,3 +305,12 @@ class Translator:
         language_code = Language.get(target_language).to_alpha3()
         preprocessed_text = f">>{language_code}<< {english_translation}"
         return self.english_to_multi_language_model.translate(preprocessed_text, target_language=target_language)
+
+    def _english_to_multi_language_batch_translation(self, texts: list[str], target_language: str) -> list[str]:
+        """Translate several texts from English to a target language."""
+        language_code = Language.get(target_language).to_alpha3()
+        preprocessed_texts = [f">>{language_code}<< {text}" for text in texts]
+        return self.english_to_multi_language_model.translate_batch(
+            preprocessed_texts,
+            target_language=target_language,
+        )
@@ -1,22 +1,55 @@
 """Translator Model.
 
 This module provides the TranslatorModel class, which handles translation tasks using the Hugging Face transformers
-library.
+library. Models can be quantized and decoded greedily to serve as a faster, lower quality tier of a language pair.
 """
 
+from typing import Any
+
+import torch
 from loguru import logger
 from transformers import pipeline
 
+from config import DEFAULT_MODEL_NAME
+from utils.profiling import timed
+
 
 class TranslatorModel:
     """A class to handle translation tasks using the Hugging Face transformers library."""
 
-    def __init__(self, source_language: str, target_language: str) -> None:
-        """Initialize the TranslatorModel with the specified source and target languages."""
-        model_name = f"Helsinki-NLP/opus-mt-{source_language}-{target_language}"
+    def __init__(
+        self,
+        source_language: str,
+        target_language: str,
+        model_name: str = DEFAULT_MODEL_NAME,
+        *,
+        quantize: bool = False,
+        greedy: bool = False,
+    ) -> None:
+        """Initialize the TranslatorModel with the specified source and target languages.
+
+        Args:
+            source_language (str): The source language of the model.
+            target_language (str): The target language of the model.
+            model_name (str): The name of the model, with "{source}" and "{target}" placeholders for the languages.
+            quantize (bool): Whether to quantize the linear layers of the model to 8-bit integer weights.
+            greedy (bool): Whether to decode greedily instead of using the beam search configured for the model.
+        """
+        model_name = model_name.format(source=source_language, target=target_language)
         self.model = pipeline(task="translation", model=model_name)
+        if quantize:
+            self.model.model = torch.ao.quantization.quantize_dynamic(  # type: ignore[no-untyped-call]
+                self.model.model,
+                {torch.nn.Linear},
+                dtype=torch.qint8,
+            )
+        self.generate_kwargs: dict[str, Any] = {"num_beams": 1} if greedy else {}
         logger.debug(f"Initialized translator model: {model_name}")
 
+    def count_tokens(self, text: str) -> int:
+        """Count the number of tokens of the given text according to the tokenizer of the model."""
+        return len(self.model.tokenizer.tokenize(text))
+
     def translate(self, text: str, source_language: str | None = None, target_language: str | None = None) -> str:
         """Translate the given text from the source language to the target language."""
         if not text.strip():
@@ -24,5 +57,38 @@ class TranslatorModel:
             logger.error(msg)
             raise ValueError(msg)
 
-        output = self.model(text, src_lang=source_language, tgt_lang=target_language, clean_up_tokenization_spaces=True)
+        with timed("inference"):
+            output = self.model(
+                text,
+                src_lang=source_language,
+                tgt_lang=target_language,
+                clean_up_tokenization_spaces=True,
+                **self.generate_kwargs,
+            )
         return output[0].get("translation_text")
+
+    def translate_batch(
+        self,
+        texts: list[str],
+        source_language: str | None = None,
+        target_language: str | None = None,
+    ) -> list[str]:
+        """Translate the given texts from the source language to the target language in a single pipeline call.
+
+        All texts are passed to the model as one batch, so callers limit the batch size by the number of texts.
+        """
+        if not all(text.strip() for text in texts):
+            msg = "Text to be translated cannot be empty"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        with timed("inference"):
+            outputs = self.model(
+                texts,
+                src_lang=source_language,
+                tgt_lang=target_language,
+                clean_up_tokenization_spaces=True,
+                batch_size=len(texts),
+                **self.generate_kwargs,
+            )
+        return [output.get("translation_text") for output in outputs]
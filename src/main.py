@@ -3,40 +3,115 @@
 This module sets up and runs a FastAPI application for a translation service.
 
 The application includes endpoints for language detection and translation,
-and serves static files from the "frontend" directory.
+and serves static files from the "frontend" directory. In router mode, it owns
+no models and forwards translation and detection requests to the backends.
 """
 
+import asyncio
+import signal
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any
 
+import httpx
 import uvicorn
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.staticfiles import StaticFiles
 from lingua import Language
+from loguru import logger
 
-from api.endpoints import detect, translate
-from config import AppConfig
+from api.deps import get_config
+from api.endpoints import admin, detect, health, metrics, proxy, translate
+from api.middleware import ProfilingMiddleware
 from core.detector import Detector
+from core.shard_router import ShardRouter
+from core.tier_policy import TierPolicy
 from core.translator import Translator
 from services.detection_service import DetectionService
+from services.routing_service import RoutingService
 from services.translation_service import TranslationService
+from utils.profiling import Profiler
 
-config = AppConfig()
+config = get_config()
+
+
+def reload_on_signal(app: FastAPI) -> None:
+    """Reload the translation models from the current configuration in the background."""
+
+    async def reload() -> None:
+        service = app.state.translation_service
+        try:
+            await run_in_threadpool(service.reload_from_config)
+        except (RuntimeError, ValueError):
+            logger.exception("Could not reload translation models")
+
+    logger.info("Received SIGHUP, reloading translation models")
+    app.state.reload_task = asyncio.create_task(reload())
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[Any, Any]:
     """Context manager for application lifespan events."""
-    app.state.detection_service = DetectionService(Detector(Language.all()))
-    app.state.translation_service = TranslationService(Translator(config.source_languages, config.target_languages))
-    yield
+    if config.mode == "router":
+        shard_map = {
+            pair: [(backend.url, backend.weight) for backend in backends] for pair, backends in config.shard_map.items()
+        }
+        limits = httpx.Limits(max_connections=config.router_max_connections)
+        async with httpx.AsyncClient(timeout=config.router_timeout, limits=limits) as client:
+            app.state.routing_service = RoutingService(ShardRouter(shard_map), client)
+            health_checks = asyncio.create_task(
+                app.state.routing_service.run_health_checks(config.router_health_check_interval),
+            )
+            try:
+                yield
+            finally:
+                health_checks.cancel()
+    else:
+        tier_policy = None
+        if config.fast_tier_enabled:
+            tier_policy = TierPolicy(
+                max_fast_tokens=config.fast_tier_max_tokens,
+                queue_depth_threshold=config.fast_tier_queue_depth,
+                fast_model_name=config.fast_tier_model,
+                quantize_fast_model=config.fast_tier_quantize,
+            )
+        translator = Translator(
+            config.source_languages,
+            config.target_languages,
+            config.get_language_pairs(),
+            tier_policy,
+        )
+        app.state.detection_service = DetectionService(Detector(Language.all()))
+        app.state.translation_service = TranslationService(translator)
+        if hasattr(signal, "SIGHUP"):
+            asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, reload_on_signal, app)
+        try:
+            yield
+        finally:
+            if hasattr(signal, "SIGHUP"):
+                asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
 
 
 app = FastAPI(lifespan=lifespan)
-app.include_router(detect.router, tags=["Language Detection"])
-app.include_router(translate.router, tags=["Translation"])
+app.state.profiler = Profiler()
+if config.profiling_sample_rate > 0 or config.slow_request_threshold_ms is not None or config.admin_token is not None:
+    app.add_middleware(
+        ProfilingMiddleware,
+        sample_rate=config.profiling_sample_rate,
+        slow_request_threshold_ms=config.slow_request_threshold_ms,
+        admin_token=config.admin_token,
+    )
+app.include_router(health.router, tags=["Health"])
+if config.mode == "router":
+    app.include_router(proxy.router, tags=["Translation"])
+else:
+    app.include_router(detect.router, tags=["Language Detection"])
+    app.include_router(translate.router, tags=["Translation"])
+    app.include_router(metrics.router, tags=["Metrics"])
+    app.include_router(admin.models_router, tags=["Admin"])
+app.include_router(admin.router, tags=["Admin"])
 app.mount(path="/", app=StaticFiles(directory="frontend", html=True), name="static")
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000)  # noqa: S104
+    uvicorn.run("main:app", host=config.host, port=config.port)
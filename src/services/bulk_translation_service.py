@@ -0,0 +1,246 @@
+"""Bulk Translation Service.
+
+This module provides the BulkTranslationService class, which translates large files offline without going through the
+HTTP API. The work is sharded across a pool of processes, each holding its own Translator and Detector, and the texts
+of every chunk are batched by language pair. Workers only load the models of the language pairs they translate.
+Progress is checkpointed after every chunk so that an interrupted run can be resumed.
+"""
+
+import json
+import time
+from collections import defaultdict, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import product
+from pathlib import Path
+from typing import Any
+
+from lingua import Language
+from loguru import logger
+
+from core.detector import Detector
+from core.translator import Translator
+from utils.file_formats import TranslationFile, TranslationUnit
+
+_worker_state: dict[str, Any] = {}
+
+
+def _init_worker(
+    source_languages: list[str],
+    target_languages: list[str],
+    language_pairs: list[tuple[str, str]] | None,
+) -> None:
+    """Create the translator of a worker process without direct models. The detector is only created once needed.
+
+    The direct model of a configured language pair is only loaded once a text of that pair is translated, so that a
+    worker does not hold the models of every configured pair when the file only needs a few of them.
+    """
+    if language_pairs is None:
+        language_pairs = list(product(source_languages, target_languages))
+    _worker_state["translator"] = Translator(source_languages, target_languages, [])
+    _worker_state["language_pairs"] = set(language_pairs)
+    _worker_state["requested_pairs"] = set()
+    _worker_state["detector"] = None
+
+
+def _load_model(source_language: str, target_language: str) -> None:
+    """Load the direct model of a configured language pair into the translator of the worker process on first use.
+
+    If the model cannot be loaded, the pair is translated with the multi-language models.
+    """
+    pair = (source_language, target_language)
+    if pair not in _worker_state["language_pairs"] or pair in _worker_state["requested_pairs"]:
+        return
+    _worker_state["requested_pairs"].add(pair)
+    translator: Translator = _worker_state["translator"]
+    try:
+        translator.reload(translator.source_languages, translator.target_languages, [*translator.models, pair])
+    except RuntimeError:
+        logger.warning(f"Translating {source_language} to {target_language} with the multi-language models")
+
+
+def _get_detector() -> Detector:
+    """Get the detector of the worker process, creating it on first use."""
+    if _worker_state.get("detector") is None:
+        _worker_state["detector"] = Detector(list(Language.all()))
+    return _worker_state["detector"]
+
+
+def translate_units(units: list[TranslationUnit], batch_size: int) -> list[str | None]:
+    """Translate the units in a worker process, in batches of texts sharing the same language pair.
+
+    The source language of units without one is detected first. Empty texts are kept as they are. Texts whose language
+    cannot be detected or which cannot be translated get None instead of a translation, so that a single bad record
+    does not abort the run and the record can be told apart from translated ones.
+    """
+    translator: Translator = _worker_state["translator"]
+    translations: list[str | None] = [text for text, _, _ in units]
+    groups: dict[tuple[str, str], list[int]] = defaultdict(list)
+    for index, (text, source_language, target_language) in enumerate(units):
+        if text.strip():
+            try:
+                language = source_language or _get_detector().detect_language(text)
+            except Exception:  # noqa: BLE001
+                logger.warning(f"Could not detect the language of {text!r}, leaving it untranslated")
+                translations[index] = None
+                continue
+            groups[(language, target_language)].append(index)
+
+    for (source_language, target_language), indices in groups.items():
+        _load_model(source_language, target_language)
+        for start in range(0, len(indices), batch_size):
+            batch = indices[start : start + batch_size]
+            texts = [units[index][0] for index in batch]
+            batch_translations: list[str | None]
+            try:
+                batch_translations = list(translator.translate_batch(texts, source_language, target_language))
+            except Exception:  # noqa: BLE001
+                batch_translations = [
+                    _translate_text(translator, text, source_language, target_language) for text in texts
+                ]
+            for index, translation in zip(batch, batch_translations, strict=True):
+                translations[index] = translation
+    return translations
+
+
+def _translate_text(translator: Translator, text: str, source_language: str, target_language: str) -> str | None:
+    """Translate a single text of a failed batch, or return None if it fails again."""
+    try:
+        return translator.translate(text, source_language, target_language)
+    except Exception:  # noqa: BLE001
+        logger.warning(f"Could not translate {text!r} from {source_language} to {target_language}, leaving it")
+        return None
+
+
+def _chunked(records: Iterable[Any], chunk_size: int) -> Iterator[list[Any]]:
+    """Split the records into lists of at most the given size."""
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+@dataclass
+class _Totals:
+    """The number of records and characters written so far, and the number of records that failed."""
+
+    records: int = 0
+    characters: int = 0
+    failed_records: int = 0
+
+
+class BulkTranslationService:
+    """A service class translating files with a pool of worker processes, checkpointing its progress."""
+
+    def __init__(
+        self,
+        source_languages: list[str],
+        target_languages: list[str],
+        language_pairs: list[tuple[str, str]] | None = None,
+        workers: int = 1,
+    ) -> None:
+        """Initialize the BulkTranslationService with the languages of the models and the number of worker processes."""
+        self.source_languages = source_languages
+        self.target_languages = target_languages
+        self.language_pairs = language_pairs
+        self.workers = workers
+
+    def translate_file(
+        self,
+        translation_file: TranslationFile,
+        checkpoint_path: Path,
+        chunk_size: int = 256,
+        batch_size: int = 32,
+        *,
+        resume: bool = False,
+    ) -> None:
+        """Translate the records of the file and write them to its output file in the same order.
+
+        Chunks of records are translated concurrently by the worker processes, and written as soon as all previous
+        chunks have been written. After every chunk, the number of written records and the size of the output file are
+        saved to the checkpoint file, which is removed once the file has been translated completely. Records that could
+        not be translated are written without a translation and counted as failed.
+        """
+        written_records, offset = self._load_checkpoint(checkpoint_path) if resume else (0, 0)
+        if written_records:
+            logger.info(f"Resuming after {written_records} records")
+
+        translation_file.open(offset)
+        start = time.perf_counter()
+        totals = _Totals()
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.source_languages, self.target_languages, self.language_pairs),
+            ) as executor:
+                pending: deque[tuple[list[Any], list[list[TranslationUnit]], Future[list[str | None]]]] = deque()
+                for chunk in _chunked(translation_file.read(skip=written_records), chunk_size):
+                    units = [translation_file.get_units(record) for record in chunk]
+                    flat_units = [unit for record_units in units for unit in record_units]
+                    pending.append((chunk, units, executor.submit(translate_units, flat_units, batch_size)))
+                    if len(pending) > self.workers:
+                        self._write_oldest_chunk(translation_file, pending, totals)
+                        offset = translation_file.checkpoint()
+                        self._save_checkpoint(checkpoint_path, written_records + totals.records, offset)
+                        self._log_throughput(totals, start)
+
+                while pending:
+                    self._write_oldest_chunk(translation_file, pending, totals)
+                    offset = translation_file.checkpoint()
+                    self._save_checkpoint(checkpoint_path, written_records + totals.records, offset)
+                    self._log_throughput(totals, start)
+
+            translation_file.checkpoint()
+        finally:
+            translation_file.close()
+
+        checkpoint_path.unlink(missing_ok=True)
+        self._log_throughput(totals, start)
+
+    @staticmethod
+    def _write_oldest_chunk(
+        translation_file: TranslationFile,
+        pending: deque[tuple[list[Any], list[list[TranslationUnit]], Future[list[str | None]]]],
+        totals: _Totals,
+    ) -> None:
+        """Wait for the translations of the oldest pending chunk, write its records and update the written totals."""
+        chunk, units, future = pending.popleft()
+        translations = iter(future.result())
+        for record, record_units in zip(chunk, units, strict=True):
+            record_translations = [next(translations) for _ in record_units]
+            translation_file.write(record, record_translations)
+            totals.records += 1
+            totals.characters += sum(len(text) for text, _, _ in record_units)
+            if None in record_translations:
+                totals.failed_records += 1
+
+    @staticmethod
+    def _log_throughput(totals: _Totals, start: float) -> None:
+        """Log the number of records and characters translated so far, the throughput and the number of failures."""
+        elapsed = max(time.perf_counter() - start, 1e-9)
+        logger.info(
+            f"Translated {totals.records} records with {totals.characters} characters in {elapsed:.1f} s "
+            f"({totals.records / elapsed:.1f} records/s, {totals.characters / elapsed:.0f} characters/s), "
+            f"{totals.failed_records} records failed",
+        )
+
+    @staticmethod
+    def _load_checkpoint(checkpoint_path: Path) -> tuple[int, int]:
+        """Load the number of written records and the size of the output file from the checkpoint file, if any."""
+        if not checkpoint_path.exists():
+            return 0, 0
+        checkpoint = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+        return checkpoint["records"], checkpoint["offset"]
+
+    @staticmethod
+    def _save_checkpoint(checkpoint_path: Path, records: int, offset: int) -> None:
+        """Save the number of written records and the size of the output file atomically to the checkpoint file."""
+        temporary_path = checkpoint_path.with_name(f"{checkpoint_path.name}.tmp")
+        temporary_path.write_text(json.dumps({"records": records, "offset": offset}), encoding="utf-8")
+        temporary_path.replace(checkpoint_path)
@@ -1,9 +1,11 @@
 """Detection Service.
 
-This module provides the DetectionService class for detecting the language of a given text.
+This module provides the DetectionService class for detecting the language of a given text. Concurrent detections of
+the same text are coalesced into a single call to the detector.
 """
 
 from core.detector import Detector
+from utils.single_flight import SingleFlight
 
 
 class DetectionService:
@@ -12,7 +14,16 @@ class DetectionService:
     def __init__(self, detector: Detector) -> None:
         """Initialize the DetectionService with a given detector."""
         self.detector = detector
+        self._single_flight = SingleFlight()
 
     def detect_language(self, text: str) -> str:
         """Detect the language of the provided text."""
-        return self.detector.detect_language(text)
+        return self._single_flight.do(text, self.detector.detect_language, text)
+
+    def detect_languages(self, text: str) -> list[tuple[str, str]]:
+        """Split the provided text into segments of a single language and detect their languages."""
+        return self._single_flight.do(("segments", text), self.detector.detect_languages, text)
+
+    def get_coalescing_stats(self) -> dict[str, int]:
+        """Get the number of detection calls and how many of them were coalesced into an in-flight call."""
+        return self._single_flight.get_stats()
@@ -0,0 +1,104 @@
+"""Routing Service.
+
+This module provides the RoutingService class, which forwards translation requests to the backend instances serving
+their language pair. It is used by the service in router mode, in which it owns no models itself.
+"""
+
+import asyncio
+from typing import Any
+
+import httpx
+from loguru import logger
+
+from core.shard_router import Backend, ShardRouter
+from core.tier_policy import Priority
+
+FAILOVER_STATUS_CODES = {502, 503, 504}
+
+
+class RoutingService:
+    """A service class forwarding requests to backends over pooled keep-alive connections, failing over on errors."""
+
+    def __init__(self, shard_router: ShardRouter, client: httpx.AsyncClient) -> None:
+        """Initialize the RoutingService with a ShardRouter and the HTTP client used to reach the backends."""
+        self.shard_router = shard_router
+        self.client = client
+
+    async def detect_language(self, text: str) -> httpx.Response:
+        """Forward the language detection to any backend and return its response.
+
+        Raises:
+            ConnectionError: If no backend could be reached.
+        """
+        return await self._post(self.shard_router.get_all_backends(), "/detect", {"text": text})
+
+    async def detect_segments(self, text: str) -> httpx.Response:
+        """Forward the detection of the segments of a text mixing several languages to any backend.
+
+        Raises:
+            ConnectionError: If no backend could be reached.
+        """
+        return await self._post(self.shard_router.get_all_backends(), "/detect/segments", {"text": text})
+
+    async def translate(
+        self,
+        text: str,
+        src_lang: str,
+        tgt_lang: str,
+        priority: Priority = "normal",
+    ) -> httpx.Response:
+        """Forward the translation to a backend serving the language pair and return its response.
+
+        Raises:
+            LookupError: If no backend serves the language pair.
+            ConnectionError: If no backend serving the language pair could be reached.
+        """
+        payload = {"text": text, "source_language": src_lang, "target_language": tgt_lang, "priority": priority}
+        return await self._post(self.shard_router.get_backends(src_lang, tgt_lang), "/translate", payload)
+
+    async def _post(self, backends: list[Backend], path: str, payload: dict[str, Any]) -> httpx.Response:
+        """Post the payload to the first backend that can be reached, marking failing ones unhealthy.
+
+        Only transport errors and the gateway errors 502, 503 and 504 count as failures of a backend. Other responses,
+        including 500 for a request the backend cannot process, are returned, so that a bad request does not mark every
+        replica unhealthy.
+        """
+        for backend in backends:
+            try:
+                response = await self.client.post(f"{backend.url}{path}", json=payload)
+            except httpx.TransportError as error:
+                logger.warning(f"Could not reach backend {backend.url}: {error!r}")
+                self.shard_router.mark_unhealthy(backend)
+                continue
+            if response.status_code in FAILOVER_STATUS_CODES:
+                logger.warning(f"Backend {backend.url} answered {path} with status {response.status_code}")
+                self.shard_router.mark_unhealthy(backend)
+                continue
+            self.shard_router.mark_healthy(backend)
+            return response
+
+        msg = f"No backend could handle the request to {path}"
+        logger.error(msg)
+        raise ConnectionError(msg)
+
+    async def check_health(self) -> None:
+        """Check the health of all backends concurrently and update their state."""
+        await asyncio.gather(*(self._check_backend_health(backend) for backend in self.shard_router.backends.values()))
+
+    async def _check_backend_health(self, backend: Backend) -> None:
+        """Check the health endpoint of the backend and update its state."""
+        try:
+            response = await self.client.get(f"{backend.url}/health")
+        except httpx.TransportError:
+            self.shard_router.mark_unhealthy(backend)
+            return
+        if response.is_success:
+            self.shard_router.mark_healthy(backend)
+        else:
+            self.shard_router.mark_unhealthy(backend)
+
+    async def run_health_checks(self, interval: float) -> None:
+        """Check the health of all backends periodically until cancelled."""
+        while True:
+            await self.check_health()
+            await asyncio.sleep(interval)
@@ -2,10 +2,17 @@
 
 This module provides the TranslationService class, which offers translation functionalities using a given Translator
 instance. The TranslationService class includes methods to get the supported source and target languages, as well as to
-translate text between languages.
+translate text between languages, including text mixing several source languages. Concurrent identical translations are
+coalesced into a single call to the translator.
 """
 
+from collections import defaultdict
+
+from config import AppConfig
+from core.tier_policy import Priority
 from core.translator import Translator
+from utils.language_utils import parse_language_pair
+from utils.single_flight import SingleFlight
 
 
 class TranslationService:
@@ -14,6 +21,7 @@ class TranslationService:
     def __init__(self, translator: Translator) -> None:
         """Initialize the TranslationService with a Translator instance."""
         self.translator = translator
+        self._single_flight = SingleFlight()
 
     def get_source_languages(self) -> list[str]:
         """Get the list of source languages supported by the translator."""
@@ -23,6 +31,98 @@ class TranslationService:
         """Get the list of target languages supported by the translator."""
         return self.translator.get_target_languages()
 
-    def translate(self, text: str, src_lang: str, tgt_lang: str) -> str:
-        """Translate text from the source language to the target language."""
-        return self.translator.translate(text, src_lang, tgt_lang)
+    def translate(self, text: str, src_lang: str, tgt_lang: str, priority: Priority = "normal") -> str:
+        """Translate text from the source language to the target language.
+
+        If an identical translation with the same priority is already in progress, its result is awaited and shared
+        instead of translating the text again.
+        """
+        return self._single_flight.do(
+            (text, src_lang, tgt_lang, priority),
+            self.translator.translate,
+            text,
+            src_lang,
+            tgt_lang,
+            priority,
+        )
+
+    def translate_segments(
+        self,
+        segments: list[tuple[str, str]],
+        tgt_lang: str,
+        priority: Priority = "normal",
+    ) -> str:
+        """Translate text consisting of segments in different source languages to the target language.
+
+        The segments are grouped by their source language and every group is translated in a single batch, which is
+        coalesced with identical in-flight batches. Segments already in the target language are kept as they are.
+        Whitespace surrounding the segments is preserved.
+        """
+        if len(segments) == 1:
+            text, src_lang = segments[0]
+            return self.translate(text, src_lang, tgt_lang, priority)
+
+        translations = [text for text, _ in segments]
+        groups: dict[str, list[int]] = defaultdict(list)
+        for index, (text, src_lang) in enumerate(segments):
+            if src_lang != tgt_lang and text.strip():
+                groups[src_lang].append(index)
+
+        for src_lang, indices in groups.items():
+            texts = [segments[index][0].strip() for index in indices]
+            batch_translations = self._single_flight.do(
+                ("batch", tuple(texts), src_lang, tgt_lang, priority),
+                self.translator.translate_batch,
+                texts,
+                src_lang,
+                tgt_lang,
+                priority,
+            )
+            for index, translation in zip(indices, batch_translations, strict=True):
+                text = segments[index][0]
+                leading_whitespace = text[: len(text) - len(text.lstrip())]
+                trailing_whitespace = text[len(text.rstrip()) :]
+                translations[index] = f"{leading_whitespace}{translation}{trailing_whitespace}"
+
+        return "".join(translations)
+
+    def reload(
+        self,
+        source_languages: list[str],
+        target_languages: list[str],
+        language_pairs: list[tuple[str, str]] | None = None,
+        refresh_pairs: list[tuple[str, str]] | None = None,
+    ) -> dict[str, list[tuple[str, str]]]:
+        """Reload the translation models of the translator while it keeps serving translations."""
+        return self.translator.reload(source_languages, target_languages, language_pairs, refresh_pairs)
+
+    def reload_from_config(
+        self,
+        source_languages: list[str] | None = None,
+        target_languages: list[str] | None = None,
+        language_pairs: list[str] | None = None,
+        refresh: list[str] | None = None,
+    ) -> dict[str, list[tuple[str, str]]]:
+        """Reload the translation models to match the current configuration, overridden by the given languages.
+
+        The configuration is read again from the environment and the `.env` file. Pairs are written as
+        "<source>-<target>".
+
+        Raises:
+            ValueError: If a language pair is not written as "<source>-<target>".
+            RuntimeError: If a model could not be loaded. The current models are kept in that case.
+        """
+        config = AppConfig()
+        pairs = config.get_language_pairs()
+        if language_pairs is not None:
+            pairs = [parse_language_pair(pair) for pair in language_pairs]
+        return self.reload(
+            source_languages if source_languages is not None else config.source_languages,
+            target_languages if target_languages is not None else config.target_languages,
+            pairs,
+            [parse_language_pair(pair) for pair in refresh or []],
+        )
+
+    def get_coalescing_stats(self) -> dict[str, int]:
+        """Get the number of translation calls and how many of them were coalesced into an in-flight call."""
+        return self._single_flight.get_stats()
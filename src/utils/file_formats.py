@@ -0,0 +1,238 @@
+"""File Formats.
+
+This module provides readers and writers for the file formats supported by the bulk translation command: JSON Lines,
+CSV and gettext PO files. Every format streams its records, extracts the texts to translate from them, and writes the
+records with their translations back in the same format, so that an interrupted run can be resumed from a checkpoint.
+"""
+
+import csv
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, TextIO
+
+import polib
+
+TranslationUnit = tuple[str, str, str]
+
+
+class JsonlFile:
+    """A JSON Lines file with one object per line, whose text field is translated into an output field."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        input_path: Path,
+        output_path: Path,
+        source_language: str,
+        target_language: str,
+        *,
+        field: str = "text",
+        output_field: str = "translation",
+    ) -> None:
+        """Initialize the JsonlFile with its paths, the default languages and the names of the text fields.
+
+        Records may override the default languages in their "source_language" and "target_language" fields.
+        """
+        self.input_path = input_path
+        self.output_path = output_path
+        self.source_language = source_language
+        self.target_language = target_language
+        self.field = field
+        self.output_field = output_field
+        self._output: TextIO | None = None
+
+    def read(self, skip: int = 0) -> Iterator[dict[str, Any]]:
+        """Stream the records of the input file, skipping the given number of records."""
+        with self.input_path.open(encoding="utf-8") as file:
+            lines = (line for line in file if line.strip())
+            for index, line in enumerate(lines):
+                if index >= skip:
+                    yield json.loads(line)
+
+    def get_units(self, record: dict[str, Any]) -> list[TranslationUnit]:
+        """Get the text of the record to translate, together with its source and target language."""
+        return [
+            (
+                str(record.get(self.field, "")),
+                record.get("source_language") or self.source_language,
+                record.get("target_language") or self.target_language,
+            ),
+        ]
+
+    def open(self, offset: int = 0) -> None:
+        """Open the output file, truncating it to the given offset to discard records written after a checkpoint."""
+        self._output = _open_output(self.output_path, offset)
+
+    def write(self, record: dict[str, Any], translations: list[str | None]) -> None:
+        """Write the record with its translation to the output file, leaving the output field empty if it failed."""
+        record[self.output_field] = translations[0] or ""
+        _get_output(self._output).write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def checkpoint(self) -> int:
+        """Flush the output file and return the offset up to which it is complete."""
+        return _flush_output(self._output)
+
+    def close(self) -> None:
+        """Close the output file."""
+        if self._output is not None:
+            self._output.close()
+
+
+class CsvFile:
+    """A CSV file with a header row, whose text column is translated into an additional output column."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        input_path: Path,
+        output_path: Path,
+        source_language: str,
+        target_language: str,
+        *,
+        field: str = "text",
+        output_field: str = "translation",
+    ) -> None:
+        """Initialize the CsvFile with its paths, the default languages and the names of the text columns.
+
+        Rows may override the default languages in their "source_language" and "target_language" columns.
+        """
+        self.input_path = input_path
+        self.output_path = output_path
+        self.source_language = source_language
+        self.target_language = target_language
+        self.field = field
+        self.output_field = output_field
+        self._output: TextIO | None = None
+        self._writer: csv.DictWriter[str] | None = None
+
+    def read(self, skip: int = 0) -> Iterator[dict[str, str]]:
+        """Stream the rows of the input file, skipping the given number of rows."""
+        with self.input_path.open(encoding="utf-8", newline="") as file:
+            for index, row in enumerate(csv.DictReader(file)):
+                if index >= skip:
+                    yield row
+
+    def get_units(self, record: dict[str, str]) -> list[TranslationUnit]:
+        """Get the text of the row to translate, together with its source and target language."""
+        return [
+            (
+                record.get(self.field) or "",
+                record.get("source_language") or self.source_language,
+                record.get("target_language") or self.target_language,
+            ),
+        ]
+
+    def open(self, offset: int = 0) -> None:
+        """Open the output file, truncating it to the given offset and writing the header if it is empty."""
+        with self.input_path.open(encoding="utf-8", newline="") as file:
+            fieldnames = list(csv.DictReader(file).fieldnames or [])
+        if self.output_field not in fieldnames:
+            fieldnames.append(self.output_field)
+
+        self._output = _open_output(self.output_path, offset, newline="")
+        self._writer = csv.DictWriter(self._output, fieldnames=fieldnames)
+        if offset == 0:
+            self._writer.writeheader()
+
+    def write(self, record: dict[str, str], translations: list[str | None]) -> None:
+        """Write the row with its translation to the output file, leaving the output column empty if it failed."""
+        if self._writer is None:
+            msg = "Output file is not open"
+            raise RuntimeError(msg)
+        record[self.output_field] = translations[0] or ""
+        self._writer.writerow(record)
+
+    def checkpoint(self) -> int:
+        """Flush the output file and return the offset up to which it is complete."""
+        return _flush_output(self._output)
+
+    def close(self) -> None:
+        """Close the output file."""
+        if self._output is not None:
+            self._output.close()
+
+
+class PoFile:
+    """A gettext PO file, whose untranslated entries get the translation of their msgid as msgstr.
+
+    The catalog is loaded as a whole and saved at every checkpoint. When resuming, the partially translated output file
+    is loaded instead of the input file, so that only the entries that are still untranslated are processed.
+    """
+
+    def __init__(self, input_path: Path, output_path: Path, source_language: str, target_language: str) -> None:
+        """Initialize the PoFile with its paths and the source and target language of its entries."""
+        self.input_path = input_path
+        self.output_path = output_path
+        self.source_language = source_language
+        self.target_language = target_language
+        self._catalog: polib.POFile | None = None
+
+    def read(self, skip: int = 0) -> Iterator[polib.POEntry]:
+        """Stream the untranslated entries of the catalog.
+
+        Already translated entries of a resumed output file are not untranslated anymore, so `skip` is not needed.
+        """
+        del skip
+        yield from list(self._get_catalog().untranslated_entries())
+
+    def get_units(self, record: polib.POEntry) -> list[TranslationUnit]:
+        """Get the singular and, if any, the plural text of the entry to translate."""
+        texts = [record.msgid, record.msgid_plural] if record.msgid_plural else [record.msgid]
+        return [(text, self.source_language, self.target_language) for text in texts]
+
+    def open(self, offset: int = 0) -> None:
+        """Load the catalog from the output file when resuming, or from the input file otherwise."""
+        path = self.output_path if offset > 0 and self.output_path.exists() else self.input_path
+        self._catalog = polib.pofile(str(path), wrapwidth=0)
+
+    def write(self, record: polib.POEntry, translations: list[str | None]) -> None:
+        """Set the translations of the entry, leaving it untranslated if any failed, so that it is retried on resume."""
+        if None in translations:
+            return
+        if record.msgid_plural:
+            plural_forms = max(len(record.msgstr_plural), 2)
+            record.msgstr_plural = {index: translations[min(index, 1)] for index in range(plural_forms)}
+        else:
+            record.msgstr = translations[0]
+
+    def checkpoint(self) -> int:
+        """Save the catalog to the output file and return a positive offset marking that it can be resumed."""
+        self._get_catalog().save(str(self.output_path))
+        return self.output_path.stat().st_size
+
+    def close(self) -> None:
+        """Release the catalog."""
+        self._catalog = None
+
+    def _get_catalog(self) -> polib.POFile:
+        """Get the loaded catalog."""
+        if self._catalog is None:
+            msg = "Catalog is not loaded"
+            raise RuntimeError(msg)
+        return self._catalog
+
+
+TranslationFile = JsonlFile | CsvFile | PoFile
+
+
+def _open_output(path: Path, offset: int, newline: str | None = None) -> TextIO:
+    """Open the output file for appending after truncating it to the given offset."""
+    if offset == 0 or not path.exists():
+        return path.open("w", encoding="utf-8", newline=newline)
+    with path.open("r+b") as file:
+        file.truncate(offset)
+    return path.open("a", encoding="utf-8", newline=newline)
+
+
+def _get_output(output: TextIO | None) -> TextIO:
+    """Get the opened output file."""
+    if output is None:
+        msg = "Output file is not open"
+        raise RuntimeError(msg)
+    return output
+
+
+def _flush_output(output: TextIO | None) -> int:
+    """Flush the output file and return its current size."""
+    output = _get_output(output)
+    output.flush()
+    return output.tell()
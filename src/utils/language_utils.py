@@ -1,6 +1,6 @@
 """Language Utils.
 
-This module provides utility functions for language code translations.
+This module provides utility functions for language code translations and language pairs.
 """
 
 import langcodes
@@ -12,3 +12,12 @@ def get_name_from_code(code: str) -> str:
         return langcodes.get(code).language_name()
     except ValueError:
         return "Invalid language code"
+
+
+def parse_language_pair(pair: str) -> tuple[str, str]:
+    """Return the source and target language codes of a language pair written as "<source>-<target>"."""
+    source_language, separator, target_language = pair.partition("-")
+    if not separator or not source_language or not target_language:
+        msg = f"Invalid language pair: {pair}"
+        raise ValueError(msg)
+    return source_language, target_language
@@ -0,0 +1,135 @@
+"""Profiling.
+
+This module provides helpers to look inside the inference hot path on demand: per-request timing breakdowns collected
+with the `timed` context manager, and the Profiler class capturing cProfile statistics for a number of requests. Both
+are inactive unless explicitly enabled for a request, in which case the instrumented code only pays for a context
+variable lookup.
+"""
+
+import cProfile
+import marshal
+import pstats
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_timings: ContextVar[dict[str, float] | None] = ContextVar("timings", default=None)
+
+
+@contextmanager
+def collect_timings() -> Iterator[dict[str, float]]:
+    """Collect the durations of all timed sections executed within the context, in milliseconds."""
+    timings: dict[str, float] = {}
+    token = _timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _timings.reset(token)
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """Add the duration of the enclosed section to the timings collected for the current request, if any."""
+    timings = _timings.get()
+    if timings is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = timings.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+
+def format_server_timing(timings: dict[str, float]) -> str:
+    """Format the collected timings as the value of a `Server-Timing` header."""
+    return ", ".join(f"{name};dur={duration:.2f}" for name, duration in timings.items())
+
+
+class ProfilingSession:
+    """A cProfile capture covering a limited number of requests or a limited amount of time."""
+
+    def __init__(self, max_requests: int, duration: float) -> None:
+        """Initialize the ProfilingSession with the number of requests and the number of seconds to capture."""
+        self.remaining_requests = max_requests
+        self.deadline = time.monotonic() + duration
+        self.profiled_requests = 0
+        self.finished = threading.Event()
+        self._stats: pstats.Stats | None = None
+
+    def is_active(self) -> bool:
+        """Check whether the session still accepts requests to profile."""
+        return not self.finished.is_set() and time.monotonic() < self.deadline
+
+    def add(self, profile: cProfile.Profile) -> None:
+        """Merge the profile of a single request into the statistics of the session."""
+        if self._stats is None:
+            self._stats = pstats.Stats(profile)
+        else:
+            self._stats.add(profile)
+        self.profiled_requests += 1
+        self.remaining_requests -= 1
+        if self.remaining_requests <= 0:
+            self.finished.set()
+
+    def dump(self) -> bytes:
+        """Serialize the statistics in the format written by `pstats.Stats.dump_stats`."""
+        return marshal.dumps(self._stats.stats if self._stats is not None else {})  # type: ignore[attr-defined]
+
+
+class Profiler:
+    """Capture cProfile statistics of the inference hot path for the next requests on demand.
+
+    Only one request is profiled at a time, since a single profiler may be active per process. Requests arriving while
+    another one is profiled are served without profiling.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the Profiler without an active session."""
+        self._session: ProfilingSession | None = None
+        self._session_lock = threading.Lock()
+        self._capture_lock = threading.Lock()
+
+    def profile(self, max_requests: int, duration: float) -> ProfilingSession:
+        """Profile the next requests until the given number of requests was profiled or the duration elapsed.
+
+        Raises:
+            RuntimeError: If another profiling session is already running.
+        """
+        if not self._session_lock.acquire(blocking=False):
+            msg = "A profiling session is already running"
+            raise RuntimeError(msg)
+
+        try:
+            session = ProfilingSession(max_requests, duration)
+            self._session = session
+            session.finished.wait(timeout=duration)
+            with self._capture_lock:
+                self._session = None
+                session.finished.set()
+            return session
+        finally:
+            self._session_lock.release()
+
+    @contextmanager
+    def capture(self) -> Iterator[None]:
+        """Profile the enclosed section if a profiling session is running and no other request is profiled."""
+        session = self._session
+        if session is None or not session.is_active() or not self._capture_lock.acquire(blocking=False):
+            yield
+            return
+
+        try:
+            profile = cProfile.Profile()
+            profile.enable()
+            try:
+                yield
+            finally:
+                profile.disable()
+                if session.is_active():
+                    session.add(profile)
+        finally:
+            self._capture_lock.release()
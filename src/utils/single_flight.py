@@ -0,0 +1,59 @@
+"""Single Flight.
+
+This module provides the SingleFlight class, which coalesces concurrent calls with the same key into a single call whose
+result is shared by all callers.
+"""
+
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from typing import Any
+
+
+class SingleFlight:
+    """Coalesce concurrent identical calls so that only one of them is executed at a time.
+
+    The first caller for a key executes the function, every caller arriving with the same key while that call is still
+    running waits for it and receives its result or exception. Once the call has finished, the next caller for that key
+    executes the function again, so results are never kept beyond the lifetime of the call.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the SingleFlight without any in-flight calls."""
+        self._lock = threading.Lock()
+        self._in_flight: dict[Hashable, Future[Any]] = {}
+        self.calls = 0
+        self.collapsed = 0
+
+    def do(self, key: Hashable, function: Callable[..., Any], *args: Any) -> Any:  # noqa: ANN401
+        """Call the function with the given arguments, or wait for an in-flight call with the same key."""
+        with self._lock:
+            self.calls += 1
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.collapsed += 1
+                is_leader = False
+            else:
+                future = Future()
+                self._in_flight[key] = future
+                is_leader = True
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = function(*args)
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def get_stats(self) -> dict[str, int]:
+        """Get the number of calls and how many of them were collapsed into an in-flight call."""
+        with self._lock:
+            return {"calls": self.calls, "collapsed": self.collapsed}
@@ -0,0 +1,99 @@
+import marshal
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.deps import get_config, get_translation_service
+from api.endpoints import admin
+from config import AppConfig
+from main import app
+from services.translation_service import TranslationService
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def override_config():
+    overrides = app.dependency_overrides.copy()
+    app.dependency_overrides[get_config] = lambda: AppConfig(admin_token="secret")
+    yield
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(overrides)
+
+
+def test_admin_endpoints_disabled_without_token():
+    app.dependency_overrides[get_config] = lambda: AppConfig(admin_token=None)
+
+    response = client.post("/admin/profile", headers={"X-Admin-Token": "secret"})
+
+    assert response.status_code == 404
+
+def test_admin_endpoints_require_valid_token():
+    response = client.post("/admin/profile", headers={"X-Admin-Token": "wrong"})
+
+    assert response.status_code == 403
+
+def test_capture_profile():
+    response = client.post("/admin/profile?requests=1&seconds=0.01", headers={"X-Admin-Token": "secret"})
+
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == 'attachment; filename="profile.pstats"'
+    assert response.headers["x-profiled-requests"] == "0"
+    assert marshal.loads(response.content) == {}
+
+@pytest.fixture
+def translation_service_mock():
+    mock = MagicMock(spec=TranslationService)
+    app.dependency_overrides[get_translation_service] = lambda: mock
+    return mock
+
+def test_reload_models(translation_service_mock):
+    translation_service_mock.reload_from_config.return_value = {
+        "added": [("en", "fr")],
+        "removed": [("de", "en")],
+        "refreshed": [("en", "de")],
+    }
+
+    response = client.post("/admin/reload", json={"refresh": ["en-de"]}, headers={"X-Admin-Token": "secret"})
+
+    assert response.status_code == 200
+    assert response.json() == {"added": ["en-fr"], "removed": ["de-en"], "refreshed": ["en-de"]}
+    translation_service_mock.reload_from_config.assert_called_once_with(None, None, None, ["en-de"])
+
+def test_reload_models_with_language_pairs(translation_service_mock):
+    translation_service_mock.reload_from_config.return_value = {"added": [], "removed": [], "refreshed": []}
+
+    response = client.post(
+        "/admin/reload",
+        json={"source_languages": ["de"], "target_languages": ["en"], "language_pairs": ["de-en"]},
+        headers={"X-Admin-Token": "secret"},
+    )
+
+    assert response.status_code == 200
+    translation_service_mock.reload_from_config.assert_called_once_with(["de"], ["en"], ["de-en"], [])
+
+def test_reload_models_failure(translation_service_mock):
+    translation_service_mock.reload_from_config.side_effect = RuntimeError("Could not load translation model for de to en")
+
+    response = client.post("/admin/reload", headers={"X-Admin-Token": "secret"})
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Could not load translation model for de to en"}
+
+def test_reload_models_invalid_pair(translation_service_mock):
+    translation_service_mock.reload_from_config.side_effect = ValueError("Invalid language pair: de")
+
+    response = client.post("/admin/reload", json={"refresh": ["de"]}, headers={"X-Admin-Token": "secret"})
+
+    assert response.status_code == 400
+
+def test_reload_models_not_available_in_router_mode():
+    router_app = FastAPI()
+    router_app.include_router(admin.router)
+    router_app.dependency_overrides[get_config] = lambda: AppConfig(admin_token="secret")
+
+    response = TestClient(router_app).post("/admin/reload", headers={"X-Admin-Token": "secret"})
+
+    assert response.status_code == 404
@@ -1,4 +1,5 @@
 from unittest.mock import MagicMock
+import pytest
 from fastapi.testclient import TestClient
 
 from api.deps import get_detection_service
@@ -11,6 +12,15 @@ detection_service_mock = MagicMock(spec=DetectionService)
 app.dependency_overrides[get_detection_service] = lambda: detection_service_mock
 
 
+@pytest.fixture(autouse=True)
+def override_detection_service():
+    overrides = app.dependency_overrides.copy()
+    app.dependency_overrides[get_detection_service] = lambda: detection_service_mock
+    yield
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(overrides)
+
+
 def test_detect_language():
     request_data = {"text": "Hello world!"}
     detection_service_mock.detect_language.return_value = "en"
@@ -19,3 +29,12 @@ def test_detect_language():
 
     assert response.status_code == 200
     assert response.json() == {"detected_language": "en"}
+
+def test_detect_segments():
+    detection_service_mock.detect_languages.return_value = [("Hallo. ", "de"), ("Hello.", "en")]
+
+    response = client.post("/detect/segments", json={"text": "Hallo. Hello."})
+
+    assert response.status_code == 200
+    assert response.json() == {"segments": [{"text": "Hallo. ", "language": "de"}, {"text": "Hello.", "language": "en"}]}
+    detection_service_mock.detect_languages.assert_called_once_with("Hallo. Hello.")
@@ -0,0 +1,36 @@
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.deps import get_detection_service, get_translation_service
+from main import app
+from services.detection_service import DetectionService
+from services.translation_service import TranslationService
+
+client = TestClient(app)
+translation_service_mock = MagicMock(spec=TranslationService)
+detection_service_mock = MagicMock(spec=DetectionService)
+
+
+@pytest.fixture(autouse=True)
+def override_services():
+    overrides = app.dependency_overrides.copy()
+    app.dependency_overrides[get_translation_service] = lambda: translation_service_mock
+    app.dependency_overrides[get_detection_service] = lambda: detection_service_mock
+    yield
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(overrides)
+
+
+def test_get_coalescing_metrics():
+    detection_service_mock.get_coalescing_stats.return_value = {"calls": 3, "collapsed": 1}
+    translation_service_mock.get_coalescing_stats.return_value = {"calls": 10, "collapsed": 4}
+
+    response = client.get("/metrics/coalescing")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "detection": {"calls": 3, "collapsed": 1},
+        "translation": {"calls": 10, "collapsed": 4},
+    }
@@ -0,0 +1,118 @@
+from unittest.mock import MagicMock
+
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.deps import get_routing_service
+from api.endpoints import proxy
+from services.routing_service import RoutingService
+
+app = FastAPI()
+app.include_router(proxy.router)
+client = TestClient(app)
+
+routing_service_mock = MagicMock(spec=RoutingService)
+app.dependency_overrides[get_routing_service] = lambda: routing_service_mock
+
+
+def test_translate_text():
+    routing_service_mock.translate.return_value = httpx.Response(
+        200, json={"detected_language": None, "translation": "Hello"}
+    )
+
+    response = client.post("/translate", json={"text": "Hallo", "source_language": "de", "target_language": "en"})
+
+    assert response.status_code == 200
+    assert response.json() == {"detected_language": None, "translation": "Hello"}
+    routing_service_mock.translate.assert_called_with("Hallo", "de", "en", "normal")
+
+def test_translate_text_without_source_language():
+    routing_service_mock.detect_segments.return_value = httpx.Response(
+        200, json={"segments": [{"text": "Bonjour", "language": "fr"}]}
+    )
+    routing_service_mock.translate.return_value = httpx.Response(
+        200, json={"detected_language": None, "translation": "Hello"}
+    )
+
+    response = client.post("/translate", json={"text": "Bonjour", "source_language": "", "target_language": "en"})
+
+    assert response.json() == {"detected_language": "fr", "translation": "Hello"}
+    routing_service_mock.translate.assert_called_with("Bonjour", "fr", "en", "normal")
+
+def test_translate_text_mixed_languages():
+    routing_service_mock.reset_mock()
+    routing_service_mock.detect_segments.return_value = httpx.Response(200, json={"segments": [
+        {"text": "Bonjour tout le monde. ", "language": "fr"},
+        {"text": "Guten Morgen zusammen. ", "language": "de"},
+        {"text": "How are you?", "language": "en"},
+    ]})
+    translations = {("fr", "Bonjour tout le monde."): "Hello everyone.", ("de", "Guten Morgen zusammen."): "Good morning."}
+    routing_service_mock.translate.side_effect = lambda text, src_lang, tgt_lang, priority: httpx.Response(
+        200, json={"detected_language": None, "translation": translations[(src_lang, text)]}
+    )
+
+    response = client.post(
+        "/translate", json={"text": "Bonjour tout le monde. Guten Morgen zusammen. How are you?", "source_language": "", "target_language": "en"}
+    )
+
+    routing_service_mock.translate.side_effect = None
+    assert response.json() == {"detected_language": "fr", "translation": "Hello everyone. Good morning. How are you?"}
+    assert routing_service_mock.translate.call_count == 2
+
+def test_translate_text_backend_error():
+    routing_service_mock.translate.return_value = httpx.Response(422, json={"detail": "Invalid"})
+
+    response = client.post("/translate", json={"text": "Hallo", "source_language": "de", "target_language": "en"})
+
+    assert response.status_code == 422
+    assert response.json() == {"detail": "Invalid"}
+
+def test_translate_text_detection_backend_error():
+    routing_service_mock.detect_segments.return_value = httpx.Response(422, json={"detail": "Invalid"})
+
+    response = client.post("/translate", json={"text": "", "source_language": "", "target_language": "en"})
+
+    assert response.status_code == 422
+    assert response.json() == {"detail": "Invalid"}
+
+def test_translate_text_backend_error_without_json():
+    routing_service_mock.translate.return_value = httpx.Response(500, text="Internal Server Error")
+
+    response = client.post("/translate", json={"text": "Hallo", "source_language": "de", "target_language": "en"})
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Internal Server Error"}
+
+def test_translate_text_unknown_language_pair():
+    routing_service_mock.translate.side_effect = LookupError("No backend serves the language pair de-xx")
+
+    response = client.post("/translate", json={"text": "Hallo", "source_language": "de", "target_language": "xx"})
+
+    routing_service_mock.translate.side_effect = None
+    assert response.status_code == 404
+
+def test_translate_text_no_backend_reachable():
+    routing_service_mock.translate.side_effect = ConnectionError("No backend could handle the request")
+
+    response = client.post("/translate", json={"text": "Hallo", "source_language": "de", "target_language": "en"})
+
+    routing_service_mock.translate.side_effect = None
+    assert response.status_code == 503
+
+def test_detect_language():
+    routing_service_mock.detect_language.return_value = httpx.Response(200, json={"detected_language": "de"})
+
+    response = client.post("/detect", json={"text": "Hallo"})
+
+    assert response.status_code == 200
+    assert response.json() == {"detected_language": "de"}
+    routing_service_mock.detect_language.assert_called_with("Hallo")
+
+def test_detect_language_no_backend_reachable():
+    routing_service_mock.detect_language.side_effect = ConnectionError("No backend could handle the request")
+
+    response = client.post("/detect", json={"text": "Hallo"})
+
+    routing_service_mock.detect_language.side_effect = None
+    assert response.status_code == 503
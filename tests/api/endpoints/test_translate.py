@@ -62,8 +62,8 @@ def test_translate_text_without_source_language():
         "source_language": "",
         "target_language": "en"
     }
-    language_detection_service_mock.detect_language.return_value = "fr"
-    translation_service_mock.translate.return_value = "Hello"
+    language_detection_service_mock.detect_languages.return_value = [("Bonjour", "fr")]
+    translation_service_mock.translate_segments.return_value = "Hello"
 
     response = client.post("/translate", json=request_data)
 
@@ -72,3 +72,85 @@ def test_translate_text_without_source_language():
         "detected_language": "fr",
         "translation": "Hello"
     }
+    translation_service_mock.translate_segments.assert_called_with([("Bonjour", "fr")], "en", "normal")
+
+def test_translate_text_with_mixed_languages():
+    request_data = {
+        "text": "Bonjour. Hallo, wie geht es dir?",
+        "source_language": "",
+        "target_language": "en"
+    }
+    language_detection_service_mock.detect_languages.return_value = [
+        ("Bonjour. ", "fr"),
+        ("Hallo, wie geht es dir?", "de"),
+    ]
+    translation_service_mock.translate_segments.return_value = "Hello. Hello, how are you?"
+
+    response = client.post("/translate", json=request_data)
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "detected_language": "de",
+        "translation": "Hello. Hello, how are you?"
+    }
+
+def test_translate_websocket():
+    language_detection_service_mock.detect_languages.return_value = [("Bonjour", "fr")]
+    translation_service_mock.translate.return_value = "Hello"
+    translation_service_mock.translate_segments.return_value = "Hello"
+
+    with client.websocket_connect("/ws/translate") as websocket:
+        websocket.send_json({"id": 1, "text": "Bonjour", "source_language": "fr", "target_language": "en"})
+        websocket.send_json({"id": "b", "text": "Bonjour", "source_language": "", "target_language": "en"})
+        responses = [websocket.receive_json(), websocket.receive_json()]
+
+    assert sorted(responses, key=lambda response: str(response["id"])) == [
+        {"id": 1, "detected_language": None, "translation": "Hello"},
+        {"id": "b", "detected_language": "fr", "translation": "Hello"},
+    ]
+
+def test_translate_websocket_invalid_request():
+    with client.websocket_connect("/ws/translate") as websocket:
+        websocket.send_json({"id": 1, "text": "Bonjour"})
+        response = websocket.receive_json()
+
+    assert response["id"] is None
+    assert response["error"].startswith("Invalid request")
+
+def test_translate_websocket_binary_message():
+    translation_service_mock.translate.return_value = "Hello"
+
+    with client.websocket_connect("/ws/translate") as websocket:
+        websocket.send_bytes(b"Bonjour")
+        error_response = websocket.receive_json()
+        websocket.send_json({"id": 2, "text": "Bonjour", "source_language": "fr", "target_language": "en"})
+        response = websocket.receive_json()
+
+    assert error_response == {"id": None, "error": "Invalid request: only text messages are supported"}
+    assert response == {"id": 2, "detected_language": None, "translation": "Hello"}
+
+def test_translate_websocket_translation_error():
+    translation_service_mock.translate.side_effect = ValueError("Text to be translated cannot be empty")
+
+    with client.websocket_connect("/ws/translate") as websocket:
+        websocket.send_json({"id": 7, "text": " ", "source_language": "en", "target_language": "de"})
+        response = websocket.receive_json()
+
+    translation_service_mock.translate.side_effect = None
+    assert response == {"id": 7, "error": "Text to be translated cannot be empty"}
+
+def test_translate_text_with_priority():
+    request_data = {"text": "Hello", "source_language": "en", "target_language": "es", "priority": "high"}
+    translation_service_mock.translate.return_value = "Hola"
+
+    response = client.post("/translate", json=request_data)
+
+    assert response.status_code == 200
+    translation_service_mock.translate.assert_called_with("Hello", "en", "es", "high")
+
+def test_translate_text_with_invalid_priority():
+    request_data = {"text": "Hello", "source_language": "en", "target_language": "es", "priority": "urgent"}
+
+    response = client.post("/translate", json=request_data)
+
+    assert response.status_code == 422
@@ -0,0 +1,52 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from loguru import logger
+
+from api.middleware import ProfilingMiddleware
+from utils.profiling import timed
+
+
+def create_client(**kwargs):
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, **kwargs)
+
+    @app.post("/echo")
+    def echo(body: dict) -> dict:
+        with timed("inference"):
+            return body
+
+    return TestClient(app)
+
+
+def test_no_timing_header_by_default():
+    response = create_client().post("/echo", json={"text": "Hello"})
+    assert response.status_code == 200
+    assert "server-timing" not in response.headers
+
+def test_timing_header_for_sampled_requests():
+    response = create_client(sample_rate=1.0).post("/echo", json={"text": "Hello"})
+    assert response.json() == {"text": "Hello"}
+    assert "inference;dur=" in response.headers["server-timing"]
+    assert "total;dur=" in response.headers["server-timing"]
+
+def test_timing_header_with_admin_token():
+    client = create_client(admin_token="secret")
+    response = client.post("/echo", json={}, headers={"X-Debug-Timing": "1", "X-Admin-Token": "secret"})
+    assert "server-timing" in response.headers
+
+def test_timing_header_with_invalid_admin_token():
+    client = create_client(admin_token="secret")
+    response = client.post("/echo", json={}, headers={"X-Debug-Timing": "1", "X-Admin-Token": "wrong"})
+    assert "server-timing" not in response.headers
+
+def test_slow_request_logging():
+    messages = []
+    handler_id = logger.add(messages.append, level="WARNING")
+    try:
+        create_client(slow_request_threshold_ms=0).post("/echo", json={"text": "Hello"})
+    finally:
+        logger.remove(handler_id)
+
+    assert len(messages) == 1
+    assert "Slow request: POST /echo" in messages[0]
+    assert "input size: 16 bytes" in messages[0]
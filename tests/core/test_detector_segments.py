@@ -0,0 +1,51 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from lingua import ConfidenceValue, Language, LanguageDetector, LanguageDetectorBuilder
+
+from core.detector import Detector
+
+
+@pytest.fixture(autouse=True)
+def mock_detector():
+    with patch("core.detector.LanguageDetectorBuilder", autospec=True) as mock_builder:
+        mocked_detector = MagicMock(LanguageDetector)
+        mocked_builder = MagicMock(LanguageDetectorBuilder)
+        mocked_builder.with_preloaded_language_models.return_value = mocked_builder
+        mocked_builder.build.return_value = mocked_detector
+        mock_builder.from_languages.return_value = mocked_builder
+        yield mocked_detector
+
+@pytest.fixture
+def detector():
+    return Detector([Language.ENGLISH, Language.FRENCH, Language.GERMAN])
+
+def test_detect_languages_confident_text_is_not_split(detector):
+    text = "Der Vertrag wurde unterschrieben. Die Lieferung erfolgt morgen."
+    detector.detector.compute_language_confidence_values.return_value = [ConfidenceValue(Language.GERMAN, 0.95)]
+    assert detector.detect_languages(text) == [(text, "de")]
+    detector.detector.compute_language_confidence_values_in_parallel.assert_not_called()
+
+def test_detect_languages_monolingual_text_stays_one_segment(detector):
+    text = "Das ist gut. Ok. Super. Wir sehen uns morgen."
+    detector.detector.compute_language_confidence_values.return_value = [ConfidenceValue(Language.GERMAN, 0.3)]
+    detector.detector.compute_language_confidence_values_in_parallel.return_value = [
+        [ConfidenceValue(Language.ENGLISH, 0.08), ConfidenceValue(Language.GERMAN, 0.07)],
+        [ConfidenceValue(Language.FRENCH, 0.06)],
+        [ConfidenceValue(Language.ENGLISH, 0.07)],
+        [ConfidenceValue(Language.GERMAN, 0.44)],
+    ]
+    assert detector.detect_languages(text) == [(text, "de")]
+
+def test_detect_languages_mixed_text(detector):
+    text = "Hallo. Wie geht es dir heute? I am fine, thank you."
+    detector.detector.compute_language_confidence_values.return_value = [ConfidenceValue(Language.GERMAN, 0.2)]
+    detector.detector.compute_language_confidence_values_in_parallel.return_value = [
+        [ConfidenceValue(Language.ENGLISH, 0.1)],
+        [ConfidenceValue(Language.GERMAN, 0.36), ConfidenceValue(Language.ENGLISH, 0.02)],
+        [ConfidenceValue(Language.ENGLISH, 0.22), ConfidenceValue(Language.GERMAN, 0.03)],
+    ]
+    assert detector.detect_languages(text) == [
+        ("Hallo. Wie geht es dir heute? ", "de"),
+        ("I am fine, thank you.", "en"),
+    ]
@@ -0,0 +1,54 @@
+import pytest
+
+from core.shard_router import ShardRouter
+
+
+@pytest.fixture
+def shard_router():
+    return ShardRouter({
+        "de-en": [("http://backend-1:8000/", 1), ("http://backend-2:8000", 3)],
+        "en-de": [("http://backend-1:8000", 1)],
+        "*": [("http://backend-3:8000", 1)],
+    })
+
+def test_backends_are_shared_between_shards(shard_router):
+    assert sorted(shard_router.backends) == ["http://backend-1:8000", "http://backend-2:8000", "http://backend-3:8000"]
+    assert shard_router.shards["de-en"][0][0] is shard_router.shards["en-de"][0][0]
+
+def test_get_backends(shard_router):
+    backends = shard_router.get_backends("de", "en")
+    assert sorted(backend.url for backend in backends) == ["http://backend-1:8000", "http://backend-2:8000"]
+
+def test_get_backends_default_shard(shard_router):
+    assert [backend.url for backend in shard_router.get_backends("fr", "it")] == ["http://backend-3:8000"]
+
+def test_get_backends_without_shard():
+    with pytest.raises(LookupError, match="No backend serves the language pair fr-it"):
+        ShardRouter({"de-en": [("http://backend-1:8000", 1)]}).get_backends("fr", "it")
+
+def test_get_backends_weighted(shard_router):
+    first_backends = [shard_router.get_backends("de", "en")[0].url for _ in range(1000)]
+    assert first_backends.count("http://backend-2:8000") > first_backends.count("http://backend-1:8000")
+
+def test_get_backends_weighted_per_shard():
+    shard_router = ShardRouter({
+        "de-en": [("http://backend-1:8000", 1), ("http://backend-2:8000", 1)],
+        "en-de": [("http://backend-1:8000", 9), ("http://backend-2:8000", 1)],
+    })
+    first_backends = [shard_router.get_backends("en", "de")[0].url for _ in range(1000)]
+    assert first_backends.count("http://backend-1:8000") > 800
+
+def test_get_backends_unhealthy_last(shard_router):
+    shard_router.mark_unhealthy(shard_router.backends["http://backend-2:8000"])
+    for _ in range(10):
+        assert [backend.url for backend in shard_router.get_backends("de", "en")] == [
+            "http://backend-1:8000",
+            "http://backend-2:8000",
+        ]
+
+def test_mark_healthy(shard_router):
+    backend = shard_router.backends["http://backend-1:8000"]
+    shard_router.mark_unhealthy(backend)
+    assert not backend.healthy
+    shard_router.mark_healthy(backend)
+    assert backend.healthy
@@ -0,0 +1,23 @@
+import pytest
+
+from core.tier_policy import TierPolicy
+
+
+@pytest.fixture
+def tier_policy():
+    return TierPolicy(max_fast_tokens=16, queue_depth_threshold=4)
+
+def test_short_input_uses_fast_tier(tier_policy):
+    assert tier_policy.select_tier(16, "normal", 0) == "fast"
+
+def test_long_input_uses_full_tier(tier_policy):
+    assert tier_policy.select_tier(17, "normal", 3) == "full"
+
+def test_queue_depth_uses_fast_tier(tier_policy):
+    assert tier_policy.select_tier(100, "normal", 4) == "fast"
+
+def test_high_priority_uses_full_tier(tier_policy):
+    assert tier_policy.select_tier(1, "high", 10) == "full"
+
+def test_low_priority_uses_fast_tier(tier_policy):
+    assert tier_policy.select_tier(100, "low", 0) == "fast"
@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import MagicMock, patch
+from core.tier_policy import TierPolicy
 from core.translator import Translator
 from core.translator_model import TranslatorModel
 
@@ -86,3 +87,116 @@ def test_create_translation_models_oserror(mock_translator_model):
     target_languages = ["fr"]
     translator = Translator(source_languages, target_languages)
     assert ("en", "fr") not in translator.models
+
+def test_create_translation_models_for_language_pairs():
+    translator = Translator(["en", "fr", "de"], ["en", "fr", "de"], [("en", "fr"), ("fr", "en")])
+    assert sorted(translator.models) == [("en", "fr"), ("fr", "en")]
+
+def test_translate_batch_same_source_target_language(translator):
+    assert translator.translate_batch(["Hello", "World"], "en", "en") == ["Hello", "World"]
+
+def test_translate_batch_empty_text(translator):
+    with pytest.raises(ValueError, match="Text to be translated cannot be empty"):
+        translator.translate_batch(["Hello", " "], "en", "fr")
+
+def test_direct_batch_translation(mock_translator_model, translator):
+    mock_translate_batch = mock_translator_model.return_value.translate_batch
+    mock_translate_batch.return_value = ["Bonjour", "Monde"]
+    result = translator.translate_batch(["Hello", "World"], "en", "fr")
+    assert result == ["Bonjour", "Monde"]
+    mock_translate_batch.assert_called_once_with(["Hello", "World"])
+
+def test_multi_step_batch_translation(mock_translator_model, translator):
+    mock_translate_batch = mock_translator_model.return_value.translate_batch
+    mock_translate_batch.side_effect = [["Hello", "World"], ["Hola", "Mundo"]]
+    result = translator.translate_batch(["Hallo", "Welt"], "de", "es")
+    assert result == ["Hola", "Mundo"]
+    mock_translate_batch.assert_any_call(["Hallo", "Welt"], source_language="de")
+    mock_translate_batch.assert_any_call([">>spa<< Hello", ">>spa<< World"], target_language="es")
+
+def test_reload_adds_and_removes_models(mock_translator_model):
+    translator = Translator(["en", "fr"], ["en", "fr"])
+    kept_model = translator.models[("en", "fr")]
+    result = translator.reload(["en", "fr", "de"], ["fr", "de"])
+    assert result == {"added": [("de", "fr"), ("en", "de"), ("fr", "de")], "removed": [("fr", "en")], "refreshed": []}
+    assert sorted(translator.models) == [("de", "fr"), ("en", "de"), ("en", "fr"), ("fr", "de")]
+    assert translator.models[("en", "fr")] is kept_model
+    assert translator.get_source_languages() == ["en", "fr", "de"]
+    assert translator.get_target_languages() == ["fr", "de"]
+
+def test_reload_refreshes_models(mock_translator_model):
+    translator = Translator(["en"], ["fr"])
+    mock_translator_model.reset_mock()
+    mock_translator_model.side_effect = lambda source, target: MagicMock(TranslatorModel, name=f"{source}-{target}")
+    result = translator.reload(["en"], ["fr"], refresh_pairs=[("en", "fr"), ("mul", "en"), ("de", "fr")])
+    assert result == {"added": [], "removed": [], "refreshed": [("en", "fr"), ("mul", "en")]}
+    assert mock_translator_model.call_count == 2
+    assert translator.models[("en", "fr")]._extract_mock_name() == "en-fr"
+    assert translator.multi_language_to_english_model._extract_mock_name() == "mul-en"
+
+def test_reload_rolls_back_on_failure(mock_translator_model):
+    translator = Translator(["en"], ["fr"])
+    models = translator.models
+    mock_translator_model.side_effect = [MagicMock(), OSError()]
+    with pytest.raises(RuntimeError, match="Could not load translation model for fr to de"):
+        translator.reload(["en", "fr"], ["fr", "de"])
+    assert translator.models is models
+    assert translator.get_source_languages() == ["en"]
+
+def test_reload_skips_unavailable_pairs(mock_translator_model):
+    mock_translator_model.side_effect = [OSError(), MagicMock(), MagicMock()]
+    translator = Translator(["en"], ["fr"])
+    mock_translator_model.side_effect = None
+    mock_translator_model.reset_mock()
+    assert translator.reload(["en"], ["fr"]) == {"added": [], "removed": [], "refreshed": []}
+    mock_translator_model.assert_not_called()
+
+@pytest.fixture
+def tiered_translator(mock_translator_model):
+    def create_model(source, target, *args, greedy=False, **kwargs):
+        model = MagicMock(TranslatorModel, name=f"{'fast' if greedy else 'full'} {source}-{target}")
+        model.count_tokens.side_effect = lambda text: len(text.split())
+        model.translate.return_value = "fast" if greedy else "full"
+        return model
+
+    mock_translator_model.side_effect = create_model
+    return Translator(["en"], ["fr"], tier_policy=TierPolicy(max_fast_tokens=2, queue_depth_threshold=1))
+
+def test_tier_policy_creates_fast_models(mock_translator_model, tiered_translator):
+    assert list(tiered_translator.fast_models) == [("en", "fr")]
+    mock_translator_model.assert_any_call(
+        "en", "fr", "Helsinki-NLP/opus-mt-{source}-{target}", quantize=True, greedy=True,
+    )
+
+def test_translate_short_text_uses_fast_tier(tiered_translator):
+    assert tiered_translator.translate("Hello world", "en", "fr") == "fast"
+
+def test_translate_long_text_uses_full_tier(tiered_translator):
+    assert tiered_translator.translate("Hello to the world", "en", "fr") == "full"
+
+def test_translate_priority_overrides_length(tiered_translator):
+    assert tiered_translator.translate("Hello", "en", "fr", "high") == "full"
+    assert tiered_translator.translate("Hello to the world", "en", "fr", "low") == "fast"
+
+def test_translate_under_load_uses_fast_tier(tiered_translator):
+    tiered_translator._in_flight = 1
+    assert tiered_translator.translate("Hello to the world", "en", "fr") == "fast"
+
+def test_translate_counts_tokens_only_at_normal_priority(tiered_translator):
+    tiered_translator.translate("Hello", "en", "fr", "high")
+    tiered_translator.translate("Hello", "en", "fr", "low")
+    tiered_translator.models[("en", "fr")].count_tokens.assert_not_called()
+    tiered_translator.translate("Hello", "en", "fr")
+    tiered_translator.models[("en", "fr")].count_tokens.assert_called_once_with("Hello")
+
+def test_translate_without_fast_model_uses_full_tier(tiered_translator):
+    tiered_translator.fast_models.clear()
+    assert tiered_translator.translate("Hello", "en", "fr", "low") == "full"
+
+def test_reload_keeps_fast_models_in_sync(tiered_translator):
+    fast_model = tiered_translator.fast_models[("en", "fr")]
+    tiered_translator.reload(["en", "de"], ["fr"])
+    assert sorted(tiered_translator.fast_models) == [("de", "fr"), ("en", "fr")]
+    assert tiered_translator.fast_models[("en", "fr")] is fast_model
+    tiered_translator.reload(["de"], ["fr"], refresh_pairs=[("de", "fr")])
+    assert list(tiered_translator.fast_models) == [("de", "fr")]
@@ -44,3 +44,39 @@ def test_translate_src_tgt_language_parameters(mock_pipeline):
     translator = TranslatorModel("en", "de")
     translator.translate("Hello, world!", "en", "de")
     mock_model.assert_called_with("Hello, world!", src_lang="en", tgt_lang="de", clean_up_tokenization_spaces=True)
+
+def test_translate_batch(mock_pipeline):
+    mock_model = MagicMock(return_value=[{"translation_text": "Hallo"}, {"translation_text": "Welt"}])
+    mock_pipeline.return_value = mock_model
+    translator = TranslatorModel("en", "de")
+    result = translator.translate_batch(["Hello", "World"])
+    assert result == ["Hallo", "Welt"]
+    mock_model.assert_called_once_with(
+        ["Hello", "World"], src_lang=None, tgt_lang=None, clean_up_tokenization_spaces=True, batch_size=2,
+    )
+
+def test_translate_batch_empty_string():
+    translator = TranslatorModel("en", "de")
+    with pytest.raises(ValueError, match="Text to be translated cannot be empty"):
+        translator.translate_batch(["Hello", ""])
+
+def test_initialization_with_model_name(mock_pipeline):
+    TranslatorModel("en", "de", "custom/opus-mt-{source}-{target}-small")
+    mock_pipeline.assert_called_once_with(task="translation", model="custom/opus-mt-en-de-small")
+
+def test_quantize(mock_pipeline):
+    with patch("core.translator_model.torch.ao.quantization.quantize_dynamic", autospec=True) as mock_quantize:
+        translator = TranslatorModel("en", "de", quantize=True)
+    assert translator.model.model is mock_quantize.return_value
+
+def test_greedy_translate(mock_pipeline):
+    mock_model = MagicMock(return_value=[{"translation_text": "Hallo"}])
+    mock_pipeline.return_value = mock_model
+    translator = TranslatorModel("en", "de", greedy=True)
+    translator.translate("Hello")
+    mock_model.assert_called_with("Hello", src_lang=None, tgt_lang=None, clean_up_tokenization_spaces=True, num_beams=1)
+
+def test_count_tokens(mock_pipeline):
+    mock_pipeline.return_value.tokenizer.tokenize.return_value = ["▁Hello", ",", "▁world"]
+    translator = TranslatorModel("en", "de")
+    assert translator.count_tokens("Hello, world") == 3
@@ -0,0 +1,136 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from services.bulk_translation_service import BulkTranslationService, _init_worker, translate_units
+from utils.file_formats import JsonlFile
+
+
+@pytest.fixture(autouse=True)
+def mock_translator():
+    with patch("services.bulk_translation_service.Translator", autospec=True) as mock:
+        mock.return_value.translate_batch.side_effect = lambda texts, src_lang, tgt_lang: [
+            f"{src_lang}-{tgt_lang}:{text}" for text in texts
+        ]
+        mock.return_value.source_languages = ["de", "fr"]
+        mock.return_value.target_languages = ["en"]
+        mock.return_value.models = {}
+        yield mock
+
+@pytest.fixture(autouse=True)
+def mock_detector():
+    with patch("services.bulk_translation_service.Detector", autospec=True) as mock:
+        mock.return_value.detect_language.return_value = "fr"
+        yield mock
+
+@pytest.fixture(autouse=True)
+def mock_process_pool():
+    with patch("services.bulk_translation_service.ProcessPoolExecutor", ThreadPoolExecutor):
+        yield
+
+@pytest.fixture
+def worker_state():
+    with patch.dict("services.bulk_translation_service._worker_state"):
+        _init_worker(["de", "fr"], ["en"], None)
+        yield
+
+@pytest.fixture
+def service():
+    return BulkTranslationService(["de", "fr"], ["en"], workers=2)
+
+@pytest.fixture
+def input_path(tmp_path):
+    path = tmp_path / "input.jsonl"
+    records = [{"text": f"Text {index}", "source_language": "de"} for index in range(10)] + [{"text": "Bonjour"}]
+    path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+    return path
+
+def read_translations(path):
+    return [json.loads(line)["translation"] for line in path.read_text(encoding="utf-8").splitlines()]
+
+def test_translate_units(mock_translator, worker_state):
+    translations = translate_units([("Hallo", "de", "en"), (" ", "de", "en"), ("Salut", "", "en")], 32)
+    assert translations == ["de-en:Hallo", " ", "fr-en:Salut"]
+
+def test_translate_units_batches_by_language_pair(mock_translator, worker_state):
+    units = [("a", "de", "en"), ("b", "fr", "en"), ("c", "de", "en"), ("d", "de", "en")]
+    translate_units(units, 2)
+    assert [call.args for call in mock_translator.return_value.translate_batch.call_args_list] == [
+        (["a", "c"], "de", "en"),
+        (["d"], "de", "en"),
+        (["b"], "fr", "en"),
+    ]
+
+def test_worker_loads_models_on_first_use(mock_translator, worker_state):
+    translator = mock_translator.return_value
+    mock_translator.assert_called_once_with(["de", "fr"], ["en"], [])
+
+    translate_units([("Hallo", "de", "en"), ("Hola", "es", "en"), ("Welt", "de", "en")], 32)
+    translate_units([("Hallo", "de", "en")], 32)
+
+    translator.reload.assert_called_once_with(["de", "fr"], ["en"], [("de", "en")])
+
+def test_worker_falls_back_if_model_cannot_be_loaded(mock_translator, worker_state):
+    translator = mock_translator.return_value
+    translator.reload.side_effect = RuntimeError("Could not load translation model")
+
+    assert translate_units([("Hallo", "de", "en")], 32) == ["de-en:Hallo"]
+    translate_units([("Hallo", "de", "en")], 32)
+
+    translator.reload.assert_called_once()
+
+def detect_french_only(text):
+    if text in ("Salut", "Bonjour"):
+        return "fr"
+    raise AttributeError("'NoneType' object has no attribute 'iso_code_639_1'")
+
+def test_translate_units_keeps_undetectable_text(mock_detector, worker_state):
+    mock_detector.return_value.detect_language.side_effect = detect_french_only
+    assert translate_units([("123", "", "en"), ("Salut", "", "en")], 32) == [None, "fr-en:Salut"]
+
+def test_translate_units_keeps_untranslatable_text(mock_translator, worker_state):
+    translator = mock_translator.return_value
+    translator.translate_batch.side_effect = ValueError("Text to be translated cannot be empty")
+    translator.translate.side_effect = lambda text, src_lang, tgt_lang: {"a": "A", "b": "B"}[text]
+    assert translate_units([("a", "de", "en"), ("bad", "de", "en"), ("b", "de", "en")], 32) == ["A", None, "B"]
+
+def test_translate_file_continues_after_undetectable_record(mock_detector, service, tmp_path):
+    mock_detector.return_value.detect_language.side_effect = detect_french_only
+    input_path = tmp_path / "input.jsonl"
+    input_path.write_text('{"text": "---"}\n{"text": "Bonjour"}\n', encoding="utf-8")
+    output_path = tmp_path / "output.jsonl"
+
+    with patch("services.bulk_translation_service.logger") as mock_logger:
+        service.translate_file(JsonlFile(input_path, output_path, "", "en"), tmp_path / "checkpoint")
+
+    assert read_translations(output_path) == ["", "fr-en:Bonjour"]
+    assert mock_logger.info.call_args.args[0].endswith("1 records failed")
+
+def test_translate_file(service, input_path, tmp_path):
+    output_path = tmp_path / "output.jsonl"
+    checkpoint_path = tmp_path / "output.jsonl.checkpoint"
+
+    service.translate_file(JsonlFile(input_path, output_path, "", "en"), checkpoint_path, chunk_size=3)
+
+    assert read_translations(output_path) == [f"de-en:Text {index}" for index in range(10)] + ["fr-en:Bonjour"]
+    assert not checkpoint_path.exists()
+
+def test_translate_file_resume(service, input_path, tmp_path):
+    output_path = tmp_path / "output.jsonl"
+    output_path.write_text(
+        '{"text": "Text 0", "translation": "done"}\n{"text": "Text 1", "translation": "discarded"}\n',
+        encoding="utf-8",
+    )
+    checkpoint_path = tmp_path / "output.jsonl.checkpoint"
+    offset = len('{"text": "Text 0", "translation": "done"}\n')
+    checkpoint_path.write_text(json.dumps({"records": 1, "offset": offset}), encoding="utf-8")
+
+    service.translate_file(
+        JsonlFile(input_path, output_path, "", "en"), checkpoint_path, chunk_size=4, resume=True
+    )
+
+    translations = read_translations(output_path)
+    assert translations[0] == "done"
+    assert translations[1:] == [f"de-en:Text {index}" for index in range(1, 10)] + ["fr-en:Bonjour"]
@@ -21,3 +21,15 @@ def test_detect_language(detection_service, mock_detector):
     result = detection_service.detect_language(text)
     mock_detector.detect_language.assert_called_once_with(text)
     assert result == "en"
+
+def test_detect_language_coalescing_stats(detection_service, mock_detector):
+    mock_detector.detect_language.return_value = "en"
+    detection_service.detect_language("Hello, world!")
+    assert detection_service.get_coalescing_stats() == {"calls": 1, "collapsed": 0}
+
+def test_detect_languages(detection_service, mock_detector):
+    text = "Hallo. Hello."
+    mock_detector.detect_languages.return_value = [("Hallo. ", "de"), ("Hello.", "en")]
+    result = detection_service.detect_languages(text)
+    mock_detector.detect_languages.assert_called_once_with(text)
+    assert result == [("Hallo. ", "de"), ("Hello.", "en")]
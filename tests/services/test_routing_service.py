@@ -0,0 +1,92 @@
+import asyncio
+
+import httpx
+import pytest
+
+from core.shard_router import ShardRouter
+from services.routing_service import RoutingService
+
+
+def create_routing_service(handler):
+    shard_router = ShardRouter({"de-en": [("http://backend-1", 1), ("http://backend-2", 1)]})
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return RoutingService(shard_router, client)
+
+def test_translate():
+    def handler(request):
+        assert request.url.path == "/translate"
+        return httpx.Response(200, json={"detected_language": None, "translation": "Hello"})
+
+    routing_service = create_routing_service(handler)
+    response = asyncio.run(routing_service.translate("Hallo", "de", "en"))
+    assert response.json() == {"detected_language": None, "translation": "Hello"}
+
+def test_translate_fails_over():
+    def handler(request):
+        if request.url.host == "backend-1":
+            raise httpx.ConnectError("Connection refused")
+        return httpx.Response(200, json={"detected_language": None, "translation": "Hello"})
+
+    routing_service = create_routing_service(handler)
+    routing_service.shard_router.mark_unhealthy(routing_service.shard_router.backends["http://backend-2"])
+    for _ in range(5):
+        response = asyncio.run(routing_service.translate("Hallo", "de", "en"))
+        assert response.json()["translation"] == "Hello"
+    assert not routing_service.shard_router.backends["http://backend-1"].healthy
+    assert routing_service.shard_router.backends["http://backend-2"].healthy
+
+def test_translate_fails_over_on_gateway_error():
+    def handler(request):
+        if request.url.host == "backend-1":
+            return httpx.Response(503)
+        return httpx.Response(200, json={"detected_language": None, "translation": "Hello"})
+
+    routing_service = create_routing_service(handler)
+    for _ in range(5):
+        assert asyncio.run(routing_service.translate("Hallo", "de", "en")).status_code == 200
+
+def test_translate_passes_internal_server_errors_through():
+    routing_service = create_routing_service(lambda request: httpx.Response(500, json={"detail": "Invalid"}))
+    assert asyncio.run(routing_service.translate(" ", "de", "en")).status_code == 500
+    assert routing_service.shard_router.backends["http://backend-1"].healthy
+    assert routing_service.shard_router.backends["http://backend-2"].healthy
+
+def test_translate_passes_client_errors_through():
+    routing_service = create_routing_service(lambda request: httpx.Response(422, json={"detail": "Invalid"}))
+    assert asyncio.run(routing_service.translate("Hallo", "de", "en")).status_code == 422
+
+def test_translate_no_backend_reachable():
+    def handler(request):
+        raise httpx.ConnectError("Connection refused")
+
+    routing_service = create_routing_service(handler)
+    with pytest.raises(ConnectionError):
+        asyncio.run(routing_service.translate("Hallo", "de", "en"))
+
+def test_translate_unknown_language_pair():
+    routing_service = create_routing_service(lambda request: httpx.Response(200))
+    with pytest.raises(LookupError):
+        asyncio.run(routing_service.translate("Bonjour", "fr", "en"))
+
+def test_detect_language():
+    routing_service = create_routing_service(lambda request: httpx.Response(200, json={"detected_language": "de"}))
+    assert asyncio.run(routing_service.detect_language("Hallo")).json() == {"detected_language": "de"}
+
+def test_detect_segments():
+    def handler(request):
+        assert request.url.path == "/detect/segments"
+        return httpx.Response(200, json={"segments": [{"text": "Hallo", "language": "de"}]})
+
+    routing_service = create_routing_service(handler)
+    response = asyncio.run(routing_service.detect_segments("Hallo"))
+    assert response.json() == {"segments": [{"text": "Hallo", "language": "de"}]}
+
+def test_check_health():
+    def handler(request):
+        assert request.url.path == "/health"
+        return httpx.Response(200 if request.url.host == "backend-1" else 503)
+
+    routing_service = create_routing_service(handler)
+    asyncio.run(routing_service.check_health())
+    assert routing_service.shard_router.backends["http://backend-1"].healthy
+    assert not routing_service.shard_router.backends["http://backend-2"].healthy
@@ -32,4 +32,56 @@ def test_translate_basic(mock_translator, translation_service):
     mock_translator.translate.return_value = translation
     result = translation_service.translate("Hello", "en", "de")
     assert result == translation
-    mock_translator.translate.assert_called_once_with("Hello", "en", "de")
+    mock_translator.translate.assert_called_once_with("Hello", "en", "de", "normal")
+
+def test_translate_coalescing_stats(mock_translator, translation_service):
+    mock_translator.translate.return_value = "Hallo"
+    translation_service.translate("Hello", "en", "de")
+    assert translation_service.get_coalescing_stats() == {"calls": 1, "collapsed": 0}
+
+def test_translate_segments_single_language(mock_translator, translation_service):
+    mock_translator.translate.return_value = "Hello"
+    result = translation_service.translate_segments([("Hallo", "de")], "en")
+    assert result == "Hello"
+    mock_translator.translate.assert_called_once_with("Hallo", "de", "en", "normal")
+
+def test_translate_segments_mixed_languages(mock_translator, translation_service):
+    mock_translator.translate_batch.side_effect = lambda texts, src_lang, tgt_lang, priority: [f"{src_lang}:{text}" for text in texts]
+    segments = [("Hallo. ", "de"), ("Bonjour.\n", "fr"), ("Hello. ", "en"), ("Tschüss.", "de")]
+    result = translation_service.translate_segments(segments, "en")
+    assert result == "de:Hallo. fr:Bonjour.\nHello. de:Tschüss."
+    assert mock_translator.translate_batch.call_count == 2
+    mock_translator.translate_batch.assert_any_call(["Hallo.", "Tschüss."], "de", "en", "normal")
+    mock_translator.translate_batch.assert_any_call(["Bonjour."], "fr", "en", "normal")
+
+def test_translate_segments_coalescing_stats(mock_translator, translation_service):
+    mock_translator.translate_batch.side_effect = lambda texts, src_lang, tgt_lang, priority: texts
+    translation_service.translate_segments([("Hallo. ", "de"), ("Bonjour.", "fr")], "en")
+    assert translation_service.get_coalescing_stats() == {"calls": 2, "collapsed": 0}
+
+def test_reload(mock_translator, translation_service):
+    mock_translator.reload.return_value = {"added": [("en", "de")], "removed": [], "refreshed": []}
+    result = translation_service.reload(["en"], ["de"], None, [("en", "de")])
+    assert result == {"added": [("en", "de")], "removed": [], "refreshed": []}
+    mock_translator.reload.assert_called_once_with(["en"], ["de"], None, [("en", "de")])
+
+def test_translate_priority(mock_translator, translation_service):
+    mock_translator.translate.return_value = "Hallo"
+    translation_service.translate("Hello", "en", "de", "high")
+    mock_translator.translate.assert_called_once_with("Hello", "en", "de", "high")
+
+def test_reload_from_config(mock_translator, translation_service, monkeypatch):
+    monkeypatch.setenv("SOURCE_LANGUAGES", '["en", "de"]')
+    monkeypatch.setenv("TARGET_LANGUAGES", '["de", "fr"]')
+    mock_translator.reload.return_value = {"added": [], "removed": [], "refreshed": [("en", "de")]}
+    result = translation_service.reload_from_config(refresh=["en-de"])
+    assert result == {"added": [], "removed": [], "refreshed": [("en", "de")]}
+    mock_translator.reload.assert_called_once_with(["en", "de"], ["de", "fr"], None, [("en", "de")])
+
+def test_reload_from_config_overrides(mock_translator, translation_service):
+    translation_service.reload_from_config(["de"], ["en"], ["de-en"])
+    mock_translator.reload.assert_called_once_with(["de"], ["en"], [("de", "en")], [])
+
+def test_reload_from_config_invalid_pair(translation_service):
+    with pytest.raises(ValueError):
+        translation_service.reload_from_config(refresh=["de"])
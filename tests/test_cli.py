@@ -0,0 +1,37 @@
+from pathlib import Path
+
+import pytest
+
+from cli import create_translation_file, parse_args
+from utils.file_formats import CsvFile, JsonlFile, PoFile
+
+
+def test_parse_args():
+    args = parse_args(["input.jsonl", "output.jsonl", "--target-language", "en", "--workers", "4"])
+    assert args.input == Path("input.jsonl")
+    assert args.source_language == ""
+    assert args.workers == 4
+    assert not args.resume
+
+@pytest.mark.parametrize("option", ["--workers", "--chunk-size", "--batch-size"])
+@pytest.mark.parametrize("value", ["0", "-1", "two"])
+def test_parse_args_rejects_non_positive_integers(option, value):
+    with pytest.raises(SystemExit):
+        parse_args(["input.jsonl", "output.jsonl", "--target-language", "en", option, value])
+
+@pytest.mark.parametrize(
+    ("file_name", "file_class"),
+    [("input.jsonl", JsonlFile), ("input.CSV", CsvFile), ("messages.po", PoFile)],
+)
+def test_create_translation_file(file_name, file_class):
+    args = parse_args([file_name, "output", "--target-language", "en"])
+    assert isinstance(create_translation_file(args), file_class)
+
+def test_create_translation_file_with_format():
+    args = parse_args(["input.txt", "output.txt", "--target-language", "en", "--format", "jsonl"])
+    assert isinstance(create_translation_file(args), JsonlFile)
+
+def test_create_translation_file_unknown_format():
+    args = parse_args(["input.txt", "output.txt", "--target-language", "en"])
+    with pytest.raises(ValueError, match="Unknown file format"):
+        create_translation_file(args)
@@ -0,0 +1,16 @@
+import pytest
+from pydantic import ValidationError
+
+from config import AppConfig, BackendConfig
+
+
+def test_backend_config_default_weight():
+    assert BackendConfig(url="http://backend-1:8000").weight == 1
+
+def test_backend_config_rejects_non_positive_weight():
+    with pytest.raises(ValidationError):
+        BackendConfig(url="http://backend-1:8000", weight=0)
+
+def test_app_config_rejects_non_positive_websocket_max_in_flight():
+    with pytest.raises(ValidationError):
+        AppConfig(websocket_max_in_flight=0)
@@ -0,0 +1,129 @@
+import json
+
+import polib
+import pytest
+
+from utils.file_formats import CsvFile, JsonlFile, PoFile
+
+
+def test_jsonl_file(tmp_path):
+    input_path = tmp_path / "input.jsonl"
+    input_path.write_text('{"text": "Hallo"}\n\n{"text": "Bonjour", "source_language": "fr"}\n', encoding="utf-8")
+    jsonl_file = JsonlFile(input_path, tmp_path / "output.jsonl", "de", "en")
+
+    records = list(jsonl_file.read())
+    assert [jsonl_file.get_units(record) for record in records] == [[("Hallo", "de", "en")], [("Bonjour", "fr", "en")]]
+
+    jsonl_file.open()
+    jsonl_file.write(records[0], ["Hello"])
+    offset = jsonl_file.checkpoint()
+    jsonl_file.write(records[1], ["Hello"])
+    jsonl_file.close()
+    lines = (tmp_path / "output.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["translation"] for line in lines] == ["Hello", "Hello"]
+
+    jsonl_file.open(offset)
+    jsonl_file.close()
+    assert len((tmp_path / "output.jsonl").read_text(encoding="utf-8").splitlines()) == 1
+
+def test_jsonl_file_skip(tmp_path):
+    input_path = tmp_path / "input.jsonl"
+    input_path.write_text('{"text": "a"}\n{"text": "b"}\n{"text": "c"}\n', encoding="utf-8")
+    jsonl_file = JsonlFile(input_path, tmp_path / "output.jsonl", "de", "en", field="text")
+    assert [record["text"] for record in jsonl_file.read(skip=2)] == ["c"]
+
+def test_csv_file(tmp_path):
+    input_path = tmp_path / "input.csv"
+    input_path.write_text("id,text\n1,Hallo\n2,\"Hallo, Welt\"\n", encoding="utf-8")
+    csv_file = CsvFile(input_path, tmp_path / "output.csv", "de", "en")
+
+    records = list(csv_file.read())
+    assert csv_file.get_units(records[1]) == [("Hallo, Welt", "de", "en")]
+
+    csv_file.open()
+    csv_file.write(records[0], ["Hello"])
+    offset = csv_file.checkpoint()
+    csv_file.close()
+
+    csv_file.open(offset)
+    csv_file.write(records[1], ["Hello, world"])
+    csv_file.close()
+    assert (tmp_path / "output.csv").read_text(encoding="utf-8").splitlines() == [
+        "id,text,translation",
+        "1,Hallo,Hello",
+        '2,"Hallo, Welt","Hello, world"',
+    ]
+
+def test_po_file(tmp_path):
+    catalog = polib.POFile()
+    catalog.append(polib.POEntry(msgid="Hallo", msgstr=""))
+    catalog.append(polib.POEntry(msgid="Welt", msgstr="World"))
+    catalog.append(polib.POEntry(msgid="ein Apfel", msgid_plural="{n} Äpfel", msgstr_plural={0: "", 1: ""}))
+    input_path = tmp_path / "input.po"
+    catalog.save(str(input_path))
+    po_file = PoFile(input_path, tmp_path / "output.po", "de", "en")
+
+    po_file.open()
+    records = list(po_file.read())
+    assert [po_file.get_units(record) for record in records] == [
+        [("Hallo", "de", "en")],
+        [("ein Apfel", "de", "en"), ("{n} Äpfel", "de", "en")],
+    ]
+    po_file.write(records[0], ["Hello"])
+    po_file.write(records[1], ["an apple", "{n} apples"])
+    po_file.checkpoint()
+    po_file.close()
+
+    output = polib.pofile(str(tmp_path / "output.po"))
+    assert [entry.msgstr for entry in output][:2] == ["Hello", "World"]
+    assert output[2].msgstr_plural == {0: "an apple", 1: "{n} apples"}
+
+def test_po_file_failed_translation(tmp_path):
+    catalog = polib.POFile()
+    catalog.append(polib.POEntry(msgid="123", msgstr=""))
+    catalog.append(polib.POEntry(msgid="ein Apfel", msgid_plural="{n} Äpfel", msgstr_plural={0: "", 1: ""}))
+    input_path = tmp_path / "input.po"
+    catalog.save(str(input_path))
+    po_file = PoFile(input_path, tmp_path / "output.po", "de", "en")
+
+    po_file.open()
+    records = list(po_file.read())
+    po_file.write(records[0], [None])
+    po_file.write(records[1], ["an apple", None])
+    po_file.checkpoint()
+    po_file.close()
+
+    output = polib.pofile(str(tmp_path / "output.po"))
+    assert [entry.msgid for entry in output.untranslated_entries()] == ["123", "ein Apfel"]
+
+def test_jsonl_and_csv_file_failed_translation(tmp_path):
+    (tmp_path / "input.jsonl").write_text('{"text": "123"}\n', encoding="utf-8")
+    (tmp_path / "input.csv").write_text("text\n123\n", encoding="utf-8")
+    for translation_file in (
+        JsonlFile(tmp_path / "input.jsonl", tmp_path / "output.jsonl", "de", "en"),
+        CsvFile(tmp_path / "input.csv", tmp_path / "output.csv", "de", "en"),
+    ):
+        translation_file.open()
+        translation_file.write(next(translation_file.read()), [None])
+        translation_file.close()
+
+    assert json.loads((tmp_path / "output.jsonl").read_text(encoding="utf-8"))["translation"] == ""
+    assert (tmp_path / "output.csv").read_text(encoding="utf-8").splitlines() == ["text,translation", "123,"]
+
+def test_po_file_resume(tmp_path):
+    catalog = polib.POFile()
+    catalog.append(polib.POEntry(msgid="Hallo", msgstr=""))
+    catalog.append(polib.POEntry(msgid="Welt", msgstr=""))
+    catalog.save(str(tmp_path / "input.po"))
+    catalog[0].msgstr = "Hello"
+    catalog.save(str(tmp_path / "output.po"))
+    po_file = PoFile(tmp_path / "input.po", tmp_path / "output.po", "de", "en")
+
+    po_file.open(offset=1)
+
+    assert [record.msgid for record in po_file.read(skip=1)] == ["Welt"]
+
+def test_write_without_open(tmp_path):
+    jsonl_file = JsonlFile(tmp_path / "input.jsonl", tmp_path / "output.jsonl", "de", "en")
+    with pytest.raises(RuntimeError, match="Output file is not open"):
+        jsonl_file.write({"text": "Hallo"}, ["Hello"])
@@ -1,6 +1,6 @@
 import pytest
 
-from utils.language_utils import get_name_from_code
+from utils.language_utils import get_name_from_code, parse_language_pair
 
 def test_valid_language_code():
     assert get_name_from_code('en') == 'English'
@@ -19,3 +19,10 @@ def test_none_language_code():
 
 def test_numeric_language_code():
     assert get_name_from_code('123') == 'Unknown language [123]'
+
+def test_parse_language_pair():
+    assert parse_language_pair('de-en') == ('de', 'en')
+
+def test_parse_invalid_language_pair():
+    with pytest.raises(ValueError, match="Invalid language pair"):
+        parse_language_pair('de')
@@ -0,0 +1,72 @@
+import marshal
+import threading
+import time
+
+import pytest
+
+from utils.profiling import Profiler, collect_timings, format_server_timing, timed
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            pytest.fail(f"Condition not met within {timeout} seconds")
+        time.sleep(0.001)
+
+
+def test_timed_without_collection():
+    with timed("section"):
+        pass
+
+def test_collect_timings():
+    with collect_timings() as timings:
+        with timed("section"):
+            pass
+        with timed("section"):
+            pass
+        with timed("other"):
+            pass
+    assert set(timings) == {"section", "other"}
+    assert all(duration >= 0 for duration in timings.values())
+
+def test_format_server_timing():
+    assert format_server_timing({"detect": 1.234, "total": 10}) == "detect;dur=1.23, total;dur=10.00"
+
+def test_capture_without_session():
+    profiler = Profiler()
+    with profiler.capture():
+        result = sum(range(10))
+    assert result == 45
+
+def test_profile_stops_after_max_requests():
+    profiler = Profiler()
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(session=profiler.profile(2, 5)))
+    thread.start()
+    wait_until(lambda: profiler._session is not None)
+    for _ in range(3):
+        with profiler.capture():
+            sum(range(1000))
+    thread.join(timeout=5)
+
+    session = result["session"]
+    assert session.profiled_requests == 2
+    assert isinstance(marshal.loads(session.dump()), dict)
+
+def test_profile_stops_after_duration():
+    profiler = Profiler()
+    session = profiler.profile(10, 0.01)
+    assert session.profiled_requests == 0
+    assert marshal.loads(session.dump()) == {}
+
+def test_profile_already_running():
+    profiler = Profiler()
+    thread = threading.Thread(target=profiler.profile, args=(1, 5))
+    thread.start()
+    wait_until(lambda: profiler._session is not None)
+    with pytest.raises(RuntimeError, match="already running"):
+        profiler.profile(1, 1)
+    with profiler.capture():
+        pass
+    thread.join(timeout=5)
@@ -0,0 +1,60 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from utils.single_flight import SingleFlight
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            pytest.fail(f"Condition not met within {timeout} seconds")
+        time.sleep(0.001)
+
+
+@pytest.fixture
+def single_flight():
+    return SingleFlight()
+
+def test_do_returns_result(single_flight):
+    assert single_flight.do("key", lambda text: text.upper(), "hello") == "HELLO"
+    assert single_flight.get_stats() == {"calls": 1, "collapsed": 0}
+
+def test_do_coalesces_concurrent_calls(single_flight):
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow_function(text):
+        calls.append(text)
+        started.set()
+        release.wait(timeout=5)
+        return text.upper()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(single_flight.do, "key", slow_function, "hello")
+        started.wait(timeout=5)
+        followers = [executor.submit(single_flight.do, "key", slow_function, "hello") for _ in range(3)]
+        wait_until(lambda: single_flight.get_stats()["collapsed"] == 3)
+        release.set()
+        results = [leader.result()] + [follower.result() for follower in followers]
+
+    assert results == ["HELLO"] * 4
+    assert calls == ["hello"]
+    assert single_flight.get_stats() == {"calls": 4, "collapsed": 3}
+
+def test_do_does_not_keep_results(single_flight):
+    single_flight.do("key", lambda: "first")
+    assert single_flight.do("key", lambda: "second") == "second"
+    assert single_flight.get_stats() == {"calls": 2, "collapsed": 0}
+
+def test_do_propagates_exception(single_flight):
+    def failing_function():
+        raise ValueError("failure")
+
+    with pytest.raises(ValueError, match="failure"):
+        single_flight.do("key", failing_function)
+    assert single_flight.do("key", lambda: "recovered") == "recovered"